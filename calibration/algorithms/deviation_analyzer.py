@@ -41,6 +41,10 @@ class DeviationAnalyzer:
         self.tape_threshold = tape_threshold
         self.screw_config = screw_config or ScrewConfig()
 
+        # Высоты углов (с усреднением) для текущей сетки; сбрасываются через invalidate()
+        self._corner_heights: Optional[Dict[str, float]] = None
+        self._corner_heights_mesh: Optional[np.ndarray] = None
+
         # Создаем винты для каждого угла
         self._build_screws()
 
@@ -50,13 +54,44 @@ class DeviationAnalyzer:
             for corner in self.bed.corners.keys()
         }
 
+    def invalidate(self, *, corner: bool = False, screw: bool = False) -> None:
+        """
+        Сброс производных данных, зависящих от изменившихся входов
+        
+        Args:
+            corner: Сетка или радиус усреднения изменились - пересчитать высоты углов
+            screw: Конфигурация винтов изменилась - пересоздать винты
+        """
+        if corner:
+            self._corner_heights = None
+            self._corner_heights_mesh = None
+        if screw:
+            self._build_screws()
+
     def set_screw_config(self, screw_config: ScrewConfig) -> None:
+        if screw_config == self.screw_config:
+            return
         self.screw_config = screw_config
-        self._build_screws()
+        self.invalidate(screw=True)
 
     def set_corner_averaging_size(self, area_size: int) -> None:
         """Update smoothing radius (in mesh points) used for corner measurements."""
-        self.corner_averaging_size = max(0, int(area_size))
+        area_size = max(0, int(area_size))
+        if area_size == self.corner_averaging_size:
+            return
+        self.corner_averaging_size = area_size
+        self.invalidate(corner=True)
+
+    def _averaged_corner_heights(self) -> Dict[str, float]:
+        """Высоты углов с усреднением corner_averaging_size (кэшируются для текущей сетки)"""
+        mesh = self.bed.mesh_data
+        if self._corner_heights is None or self._corner_heights_mesh is not mesh:
+            self._corner_heights = {
+                corner: self.bed.get_corner_height(corner, self.corner_averaging_size)
+                for corner in self.bed.corners.keys()
+            }
+            self._corner_heights_mesh = mesh
+        return self._corner_heights
 
     def get_stats(self) -> DeviationStats:
         """Получение статистики отклонений"""
@@ -64,8 +99,7 @@ class DeviationAnalyzer:
         
         # Рассчитываем отклонения в углах
         corner_deviations = {}
-        for corner in self.bed.corners.keys():
-            height = self.bed.get_corner_height(corner, self.corner_averaging_size)
+        for corner, height in self._averaged_corner_heights().items():
             deviation = abs(height - mean_height)
             corner_deviations[corner] = deviation
             
@@ -84,8 +118,7 @@ class DeviationAnalyzer:
         stats = self.get_stats()
         
         # Находим максимальную разницу между углами
-        heights = [self.bed.get_corner_height(corner, self.corner_averaging_size) 
-                  for corner in self.bed.corners.keys()]
+        heights = list(self._averaged_corner_heights().values())
         max_corner_diff = max(heights) - min(heights)
         
         # Определяем проблемные углы
@@ -190,9 +223,10 @@ class DeviationAnalyzer:
         """Получение необходимых действий для углов"""
         ideal_plane = self.get_ideal_plane()
         actions = {}
+        corner_heights = self._averaged_corner_heights()
         
         for corner, (x, y) in self.bed.corners.items():
-            current_height = self.bed.get_corner_height(corner, self.corner_averaging_size)
+            current_height = corner_heights[corner]
             target_height = ideal_plane[x, y]
             
             screw = self.screws[corner]
@@ -1,4 +1,4 @@
 """Workflow utilities for staged bed calibration."""
 
-from .engine import compute_workflow  # noqa: F401
+from .engine import clear_workflow_cache, compute_workflow, settings_key  # noqa: F401
 from .models import StageAction, StageResult, WorkflowData  # noqa: F401
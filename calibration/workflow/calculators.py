@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
@@ -35,8 +36,8 @@ def compute_initial_stage(mesh: np.ndarray) -> StageResult:
         deviation=deviation,
         baseline=None,
         mesh=mesh.copy(),
-        actions=[],
-        warnings=[],
+        actions=(),
+        warnings=(),
         help_key='visual_rec.help.initial',
     )
 
@@ -193,9 +194,12 @@ def _apply_belt_adjustments(
     balanced = _normalise_mesh_load(base_mesh, result)
     balanced_delta = balanced - base_mesh
     load_range = float(np.max(balanced_delta) - np.min(balanced_delta))
-    for action in actions.values():
-        action.metadata['removed_offset'] = offset_removed
-        action.metadata['load_range'] = load_range
+    for identifier, action in list(actions.items()):
+        actions[identifier] = replace(action, metadata={
+            **action.metadata,
+            'removed_offset': offset_removed,
+            'load_range': load_range,
+        })
     return balanced
 
 
@@ -218,8 +222,8 @@ def build_belt_stage(
             deviation=baseline,
             baseline=baseline,
             mesh=mesh_before.copy(),
-            actions=[],
-            warnings=['visual_rec.stage_disabled'],
+            actions=(),
+            warnings=('visual_rec.stage_disabled',),
             help_key='visual_rec.help.belts',
         )
         return stage, mesh_before
@@ -234,7 +238,7 @@ def build_belt_stage(
     deviation_after = compute_stage_deviation(mesh_after)
 
     actions = [actions_dict[key] for key in ('front_left', 'front_right', 'back') if key in actions_dict]
-    warnings = ['visual_rec.belt_no_adjustments'] if not actions else []
+    warnings = ('visual_rec.belt_no_adjustments',) if not actions else ()
 
     stage = StageResult(
         key='after_belts',
@@ -244,7 +248,7 @@ def build_belt_stage(
         deviation=deviation_after,
         baseline=baseline,
         mesh=mesh_after.copy(),
-        actions=actions,
+        actions=tuple(actions),
         warnings=warnings,
         help_key='visual_rec.help.belts',
     )
@@ -284,8 +288,8 @@ def build_screw_stage(
             deviation=baseline,
             baseline=baseline,
             mesh=base_mesh.copy(),
-            actions=[],
-            warnings=['visual_rec.stage_disabled'],
+            actions=(),
+            warnings=('visual_rec.stage_disabled',),
             help_key='visual_rec.help.screws',
         )
         return stage, base_mesh
@@ -298,7 +302,7 @@ def build_screw_stage(
 
     deviation_after = compute_stage_deviation(mesh_after)
     actions = _build_screw_actions(adjustments)
-    warnings = ['visual_rec.screw_no_adjustments'] if not actions else []
+    warnings = ('visual_rec.screw_no_adjustments',) if not actions else ()
 
     stage = StageResult(
         key='after_screws',
@@ -308,7 +312,7 @@ def build_screw_stage(
         deviation=deviation_after,
         baseline=baseline,
         mesh=mesh_after.copy(),
-        actions=actions,
+        actions=tuple(actions),
         warnings=warnings,
         help_key='visual_rec.help.screws',
     )
@@ -346,8 +350,8 @@ def build_tape_stage(
             deviation=baseline,
             baseline=baseline,
             mesh=base_mesh.copy(),
-            actions=[],
-            warnings=['visual_rec.stage_disabled'],
+            actions=(),
+            warnings=('visual_rec.stage_disabled',),
             help_key='visual_rec.help.tape',
         )
         return stage, base_mesh
@@ -359,7 +363,7 @@ def build_tape_stage(
 
     deviation_after = compute_stage_deviation(mesh_after)
     actions = _build_tape_actions(spots, settings['hardware']['tape_thickness'])
-    warnings = ['visual_rec.tape_no_adjustments'] if not actions else []
+    warnings = ('visual_rec.tape_no_adjustments',) if not actions else ()
 
     stage = StageResult(
         key='after_tape',
@@ -369,7 +373,7 @@ def build_tape_stage(
         deviation=deviation_after,
         baseline=baseline,
         mesh=mesh_after.copy(),
-        actions=actions,
+        actions=tuple(actions),
         warnings=warnings,
         help_key='visual_rec.help.tape',
     )
@@ -517,7 +521,7 @@ def build_temperature_stage(
     deviation_after = compute_stage_deviation(mesh_after)
 
     enabled = bool(enabled_flag and abs(deviation_after - baseline) > 1e-6)
-    warnings = ['visual_rec.temperature_no_adjustments'] if not enabled else []
+    warnings = ('visual_rec.temperature_no_adjustments',) if not enabled else ()
 
     stage = StageResult(
         key='after_temperature',
@@ -527,7 +531,7 @@ def build_temperature_stage(
         deviation=deviation_after,
         baseline=baseline,
         mesh=mesh_after.copy(),
-        actions=[],
+        actions=(),
         warnings=warnings,
         help_key='visual_rec.help.temperature',
         metadata=info,
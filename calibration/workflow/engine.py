@@ -2,7 +2,21 @@
 
 from __future__ import annotations
 
-from typing import Dict
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import astuple
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+try:
+    import xxhash  # type: ignore
+
+    _HAS_XXHASH = True
+except Exception:  # noqa: BLE001
+    xxhash = None  # type: ignore[assignment]
+    _HAS_XXHASH = False
 
 from calibration.algorithms.deviation_analyzer import DeviationAnalyzer
 from calibration.algorithms.screw_solver import ScrewSolver
@@ -16,59 +30,157 @@ from .calculators import (
     build_temperature_stage,
     compute_initial_stage,
 )
-from .models import StageResult, WorkflowData
+from .models import WorkflowData
+
+# compute_workflow is a pure function of the mesh, the solver configuration and
+# the settings payload, while the UI asks for it on every refresh.  Keep the
+# last few results around keyed by a fingerprint of those inputs.  The key holds
+# values only, so copies of the same bed and solvers share entries and the cache
+# keeps no solver objects alive.
+_WORKFLOW_CACHE_SIZE = 8
+_workflow_cache: "OrderedDict[Tuple[Hashable, ...], WorkflowData]" = OrderedDict()
+# The UI may compute workflows on a worker thread; the lock only guards the
+# cache itself, computations run outside of it.
+_workflow_cache_lock = threading.Lock()
+
+
+def clear_workflow_cache() -> None:
+    """Drop memoised workflows, e.g. after mutating a mesh array in place."""
+    with _workflow_cache_lock:
+        _workflow_cache.clear()
+
+
+def settings_key(settings: Dict) -> Hashable:
+    """Hashable form of a settings payload, see ``compute_workflow(frozen_settings=...)``."""
+    return _freeze(settings)
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _mesh_fingerprint(mesh: np.ndarray) -> Tuple[Hashable, ...]:
+    # Both hashers read the array buffer directly, without a tobytes() copy;
+    # xxh3 is much cheaper per byte when the optional package is installed.
+    data = np.ascontiguousarray(mesh)
+    if _HAS_XXHASH:
+        digest = xxhash.xxh3_128_digest(data.data)
+    else:
+        digest = hashlib.blake2b(data.data, digest_size=16).digest()
+    return data.shape, data.dtype.str, digest
+
 
-DEFAULT_WORKFLOW_FLAGS: Dict[str, bool] = {
-    'enable_belt': True,
-    'enable_screws': True,
-    'enable_tape': True,
-}
+def _workflow_key(
+    bed: Bed,
+    analyzer: Optional[DeviationAnalyzer],
+    screw_solver: Optional[ScrewSolver],
+    tape_calculator: Optional[TapeCalculator],
+    settings: Dict,
+    frozen_settings: Optional[Hashable] = None,
+) -> Tuple[Hashable, ...]:
+    # Everything the stages read from the bed and solvers is captured by value;
+    # the solvers derive the rest (screws, corner weights) from it.
+    solver_state = (
+        (
+            analyzer.corner_averaging_size,
+            analyzer.screw_threshold,
+            analyzer.tape_threshold,
+            astuple(analyzer.screw_config),
+        ) if analyzer is not None else None,
+        astuple(screw_solver.screw_config) if screw_solver is not None else None,
+        (
+            tape_calculator.tape_thickness,
+            tape_calculator.min_height_diff,
+        ) if tape_calculator is not None else None,
+    )
+    return (
+        astuple(bed.config),
+        _mesh_fingerprint(bed.mesh_data),
+        solver_state,
+        _freeze(settings) if frozen_settings is None else frozen_settings,
+    )
 
 
 def compute_workflow(
     bed: Bed,
-    analyzer: DeviationAnalyzer,
-    screw_solver: ScrewSolver,
-    tape_calculator: TapeCalculator,
+    analyzer: Optional[DeviationAnalyzer],
+    screw_solver: Optional[ScrewSolver],
+    tape_calculator: Optional[TapeCalculator],
     settings: Dict,
+    *,
+    frozen_settings: Optional[Hashable] = None,
 ) -> WorkflowData:
-    """Compose stage-by-stage calibration results for UI consumption."""
-    workflow_flags = {
-        **DEFAULT_WORKFLOW_FLAGS,
-        **settings.get('workflow', {}),
-    }
+    """Compose stage-by-stage calibration results for UI consumption.
+
+    Passing ``None`` for a solver disables the stages that need it: the belt
+    stage needs ``screw_solver``, the screw stage needs ``analyzer`` and
+    ``screw_solver``, the tape stage needs ``tape_calculator``.
+
+    Callers that reuse one payload across calls may pass its precomputed
+    ``settings_key(settings)`` as ``frozen_settings`` to skip re-freezing it
+    for the cache lookup.
+    """
+    key = _workflow_key(bed, analyzer, screw_solver, tape_calculator, settings, frozen_settings)
+    with _workflow_cache_lock:
+        cached = _workflow_cache.get(key)
+        if cached is not None:
+            _workflow_cache.move_to_end(key)
+            return cached
+
+    workflow = _compute_workflow(bed, analyzer, screw_solver, tape_calculator, settings)
+    with _workflow_cache_lock:
+        _workflow_cache[key] = workflow
+        if len(_workflow_cache) > _WORKFLOW_CACHE_SIZE:
+            _workflow_cache.popitem(last=False)
+    return workflow
+
+
+def _compute_workflow(
+    bed: Bed,
+    analyzer: Optional[DeviationAnalyzer],
+    screw_solver: Optional[ScrewSolver],
+    tape_calculator: Optional[TapeCalculator],
+    settings: Dict,
+) -> WorkflowData:
+    user_flags = settings.get('workflow') or {}
+    enable_belt = user_flags.get('enable_belt', True) and screw_solver is not None
+    enable_screws = (
+        user_flags.get('enable_screws', True)
+        and analyzer is not None
+        and screw_solver is not None
+    )
+    enable_tape = user_flags.get('enable_tape', True) and tape_calculator is not None
     env_settings = settings.get('environment', {})
 
-    stages: list[StageResult] = []
     mesh_state = bed.mesh_data.copy()
 
     initial_stage = compute_initial_stage(mesh_state)
-    stages.append(initial_stage)
 
     belt_stage, mesh_state = build_belt_stage(
         bed,
         screw_solver,
         settings,
         mesh_state,
-        workflow_flags.get('enable_belt', True),
+        enable_belt,
     )
-    stages.append(belt_stage)
 
     screw_stage, mesh_state = build_screw_stage(
         analyzer,
         screw_solver,
         mesh_state,
-        workflow_flags.get('enable_screws', True),
+        enable_screws,
     )
-    stages.append(screw_stage)
 
     tape_stage, mesh_state = build_tape_stage(
         tape_calculator,
         mesh_state,
         settings,
-        workflow_flags.get('enable_tape', True),
+        enable_tape,
     )
-    stages.append(tape_stage)
 
     temperature_stage, mesh_state = build_temperature_stage(
         bed,
@@ -77,12 +189,12 @@ def compute_workflow(
         enabled_flag=True,
         thermal_model=settings.get('thermal_model'),
     )
-    stages.append(temperature_stage)
 
-    enabled_stages = [stage for stage in stages if stage.enabled]
-    best_stage = (
-        min(enabled_stages, key=lambda stage: stage.deviation)
-        if enabled_stages else stages[0]
+    stages = (initial_stage, belt_stage, screw_stage, tape_stage, temperature_stage)
+    best_stage = min(
+        (stage for stage in stages if stage.enabled),
+        key=lambda stage: stage.deviation,
+        default=initial_stage,
     )
 
     return WorkflowData(
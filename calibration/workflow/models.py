@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 import numpy as np
 
+# Shared read-only mapping handed out as the default metadata so that
+# constructing a stage or action does not allocate an empty dict every time.
+EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass
+
+def _empty_metadata() -> Mapping[str, Any]:
+    return EMPTY_METADATA
+
+
+@dataclass(frozen=True, slots=True)
 class StageAction:
     """Single actionable step for a calibration stage."""
 
@@ -20,10 +29,10 @@ class StageAction:
     teeth: Optional[int] = None
     minutes: Optional[float] = None
     degrees: Optional[float] = None
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=_empty_metadata)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StageResult:
     """Result of one calibration stage."""
 
@@ -34,16 +43,16 @@ class StageResult:
     deviation: float
     baseline: Optional[float]
     mesh: np.ndarray
-    actions: List[StageAction] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
+    actions: Tuple[StageAction, ...] = ()
+    warnings: Tuple[str, ...] = ()
     help_key: Optional[str] = None
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=_empty_metadata)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkflowData:
     """Aggregated calibration workflow information."""
 
-    stages: List[StageResult]
+    stages: Tuple[StageResult, ...]
     best_stage: StageResult
     active_thermal_model: Optional[Dict[str, float]] = None
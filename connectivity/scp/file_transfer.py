@@ -6,8 +6,9 @@
 
 import paramiko
 import os
+import shlex
 import logging
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from scp import SCPClient
 
 
@@ -81,7 +82,7 @@ class SCPFileTransfer:
         try:
             # Создаем директорию назначения, если она не существует
             local_dir = os.path.dirname(local_path)
-            if local_dir and not os.path.exists(local_dir):
+            if local_dir:
                 os.makedirs(local_dir, exist_ok=True)
             
             self.scp_client.get(remote_path, local_path)
@@ -152,26 +153,25 @@ class SCPFileTransfer:
                 return 0
         
         # Создаем локальную директорию, если она не существует
-        if not os.path.exists(local_dir):
-            os.makedirs(local_dir, exist_ok=True)
+        os.makedirs(local_dir, exist_ok=True)
         
         try:
             # Получаем список файлов в удаленной директории
-            command = f"find {remote_dir} -type f" if recursive else f"find {remote_dir} -maxdepth 1 -type f"
-            stdin, stdout, stderr = self.ssh_client.exec_command(command)
-            
-            remote_files = [line.strip() for line in stdout.readlines() if line.strip()]
+            depth = "" if recursive else " -maxdepth 1"
+            command = f"find {shlex.quote(remote_dir)}{depth} -type f -print0"
             
-            # Загружаем каждый файл
+            # Загружаем каждый файл по мере получения списка
             downloaded_count = 0
-            for remote_path in remote_files:
+            created_dirs = {local_dir}
+            for remote_path in self._iter_remote_paths(command):
                 # Создаем относительный путь для локального файла
                 rel_path = os.path.relpath(remote_path, remote_dir)
                 local_path = os.path.join(local_dir, rel_path)
                 
                 # Создаем локальную директорию, если нужно
                 local_file_dir = os.path.dirname(local_path)
-                if not os.path.exists(local_file_dir):
+                if local_file_dir not in created_dirs:
+                    created_dirs.add(local_file_dir)
                     os.makedirs(local_file_dir, exist_ok=True)
                 
                 # Загружаем файл
@@ -184,6 +184,31 @@ class SCPFileTransfer:
             logging.error(f"Directory download error: {str(e)}")
             return 0
     
+    def _iter_remote_paths(self, command: str) -> Iterator[str]:
+        """
+        Выполняет команду вида `find ... -print0` и отдает пути по мере чтения
+        
+        Args:
+            command: Команда, выводящая пути, разделенные нулевым байтом
+            
+        Yields:
+            str: Путь к файлу на удаленном сервере
+        """
+        stdin, stdout, stderr = self.ssh_client.exec_command(command)
+        channel = stdout.channel
+        pending = b""
+        while True:
+            chunk = channel.recv(65536)
+            if not chunk:
+                break
+            pending += chunk
+            *complete, pending = pending.split(b"\x00")
+            for raw_path in complete:
+                if raw_path:
+                    yield raw_path.decode("utf-8", errors="replace")
+        if pending:
+            yield pending.decode("utf-8", errors="replace")
+    
     def find_and_get_files(self, remote_dir: str, pattern: str, local_dir: str) -> List[str]:
         """
         Ищет файлы по шаблону в удаленной директории и загружает их
@@ -202,18 +227,13 @@ class SCPFileTransfer:
         
         try:
             # Создаем локальную директорию, если она не существует
-            if not os.path.exists(local_dir):
-                os.makedirs(local_dir, exist_ok=True)
+            os.makedirs(local_dir, exist_ok=True)
                 
-            # Ищем файлы по шаблону
-            command = f"find {remote_dir} -name '{pattern}' -type f"
-            stdin, stdout, stderr = self.ssh_client.exec_command(command)
-            
-            remote_files = [line.strip() for line in stdout.readlines() if line.strip()]
+            # Ищем файлы по шаблону и загружаем их по мере получения списка
+            command = f"find {shlex.quote(remote_dir)} -name {shlex.quote(pattern)} -type f -print0"
             
-            # Загружаем каждый файл
             downloaded_files = []
-            for remote_path in remote_files:
+            for remote_path in self._iter_remote_paths(command):
                 local_path = os.path.join(local_dir, os.path.basename(remote_path))
                 if self.get_file(remote_path, local_path):
                     downloaded_files.append(local_path)
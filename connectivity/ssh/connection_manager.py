@@ -6,10 +6,16 @@
 
 import paramiko
 import os
+import shlex
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, Optional, Dict, List
 
 
+# Максимальное число одновременных загрузок поверх одного SSH-соединения
+MAX_PARALLEL_TRANSFERS = 4
+
+
 class SSHConnectionManager:
     """Класс для управления SSH-соединениями"""
     
@@ -117,7 +123,7 @@ class SSHConnectionManager:
         Returns:
             List[str]: Список полных путей к найденным файлам
         """
-        command = f"find {remote_dir} -name '{pattern}' -type f"
+        command = f"find {shlex.quote(remote_dir)} -name {shlex.quote(pattern)} -type f"
         exit_code, stdout, _ = self.execute_command(command)
         
         if exit_code == 0:
@@ -135,8 +141,7 @@ class SSHConnectionManager:
         Returns:
             Optional[str]: Полный путь к загруженному файлу или None в случае ошибки
         """
-        if not os.path.exists(local_dir):
-            os.makedirs(local_dir, exist_ok=True)
+        os.makedirs(local_dir, exist_ok=True)
         
         local_path = os.path.join(local_dir, os.path.basename(remote_config_path))
         
@@ -154,16 +159,21 @@ class SSHConnectionManager:
         Returns:
             List[str]: Список полных путей к загруженным файлам
         """
-        if not os.path.exists(local_dir):
-            os.makedirs(local_dir, exist_ok=True)
+        os.makedirs(local_dir, exist_ok=True)
         
         # Поиск файлов с данными акселерометра
         remote_files = self.find_files("/tmp", "calibration_data_*.csv")
+        if not remote_files or not self.client:
+            return []
         
-        downloaded_files = []
-        for remote_file in remote_files:
-            local_path = os.path.join(local_dir, os.path.basename(remote_file))
-            if self.get_file(remote_file, local_path):
-                downloaded_files.append(local_path)
+        # Каждый вызов get_file открывает собственный канал в общем транспорте,
+        # поэтому файлы можно скачивать параллельно без новых подключений
+        local_paths = [
+            os.path.join(local_dir, os.path.basename(remote_file))
+            for remote_file in remote_files
+        ]
+        workers = min(MAX_PARALLEL_TRANSFERS, len(remote_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self.get_file, remote_files, local_paths))
         
-        return downloaded_files
\ No newline at end of file
+        return [path for path, ok in zip(local_paths, results) if ok]
\ No newline at end of file
@@ -24,9 +24,11 @@
 
 from __future__ import annotations
 
+import io
 import math
 import re
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
@@ -49,26 +51,45 @@ class MeshData:
     max_y: float           # Максимальная координата Y
     algo: str = ""         # Алгоритм интерполяции (bicubic / lagrange)
 
+    # Статистика считается один раз при создании — матрица после этого не меняется
+    _min: float = field(init=False, repr=False, compare=False)
+    _max: float = field(init=False, repr=False, compare=False)
+    _mean: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.matrix.size:
+            flat = self.matrix.ravel()
+            self._min = float(flat.min())
+            self._max = float(flat.max())
+            self._mean = float(flat.mean())
+        else:
+            self._min = self._max = self._mean = float("nan")
+
     @property
+    def flat_view(self) -> np.ndarray:
+        """Плоское представление матрицы построчно (без копирования)."""
+        return self.matrix.ravel()
+
+    @cached_property
     def flat_points(self) -> List[float]:
         """Плоский список значений построчно."""
-        return self.matrix.flatten().tolist()
+        return self.matrix.ravel().tolist()
 
     @property
     def min_value(self) -> float:
-        return float(np.min(self.matrix))
+        return self._min
 
     @property
     def max_value(self) -> float:
-        return float(np.max(self.matrix))
+        return self._max
 
     @property
     def range_value(self) -> float:
-        return self.max_value - self.min_value
+        return self._max - self._min
 
     @property
     def mean_value(self) -> float:
-        return float(np.mean(self.matrix))
+        return self._mean
 
     def __repr__(self) -> str:
         return (
@@ -87,6 +108,28 @@ _MESH_PREFIXES: Tuple[str, ...] = (
     "besh_profile_",
     "bed_mesh_profile_",
 )
+_PREFIX_LENS: Tuple[int, ...] = tuple(len(p) for p in _MESH_PREFIXES)
+
+# Пустые значения между запятыми («1, , 2»). np.fromstring превратил бы их
+# в -1, поэтому такие места схлопываются до разбора.
+_RE_EMPTY_FIELDS = re.compile(r",(?:\s*,)+")
+
+# Текстовый режим np.fromstring — старый интерфейс NumPy; если его нет,
+# используется векторное приведение строк к float64 (тоже без float() в Python).
+_HAS_FROMSTRING = hasattr(np, "fromstring")
+
+
+def _parse_points(raw_points: str) -> np.ndarray:
+    """
+    Разбирает строку «v1, v2, ...» в одномерный массив float64.
+
+    Пустые значения между запятыми должны быть убраны заранее.
+    """
+    if not raw_points:
+        return np.empty(0, dtype=np.float64)
+    if _HAS_FROMSTRING:
+        return np.fromstring(raw_points, dtype=np.float64, sep=",")
+    return np.asarray(raw_points.split(","), dtype=np.float64)
 
 
 class FlashforgeMeshParser:
@@ -106,8 +149,6 @@ class FlashforgeMeshParser:
 
     # [section name]  — может содержать пробелы и символы
     _RE_SECTION = re.compile(r"^\[([^\]]+)\]\s*$")
-    # key : value  — пробелы вокруг двоеточия опциональны; не захватываем комментарии
-    _RE_PARAM = re.compile(r"^([^:#][^:]*?)\s*:\s*(.*?)\s*$")
 
     # ── публичный API ───────────────────────────────────────
 
@@ -150,15 +191,13 @@ class FlashforgeMeshParser:
         if mesh_data.matrix.shape != (mesh_data.y_count, mesh_data.x_count):
             return False
 
-        # Проверяем на NaN / Inf
-        if np.any(np.isnan(mesh_data.matrix)) or np.any(np.isinf(mesh_data.matrix)):
-            return False
-
-        # Типичные отклонения стола не превышают ±10 мм
-        if np.any(np.abs(mesh_data.matrix) > 10):
-            return False
+        if not mesh_data.matrix.size:
+            return True
 
-        return True
+        # NaN / Inf и выход за ±10 мм (типичные отклонения стола меньше)
+        # проверяются по уже посчитанным min/max без прохода по матрице:
+        # NaN не проходит ни одно сравнение, а ±Inf выходит за диапазон
+        return -10 <= mesh_data.min_value and mesh_data.max_value <= 10
 
     # ── внутренние методы ───────────────────────────────────
 
@@ -173,35 +212,36 @@ class FlashforgeMeshParser:
         current_section: Optional[str] = None
         current_params: Dict[str, str] = {}
 
-        for raw_line in content.splitlines():
+        # Построчно без списка всех строк; режим universal newlines
+        # приводит «\r\n» и «\r» к «\n», хвостовой «\n» снимает strip ниже
+        for raw_line in io.StringIO(content, newline=None):
+            # Отрезаем комментарий (целой строкой или инлайн) одним поиском
+            hash_pos = raw_line.find("#")
+            if hash_pos >= 0:
+                raw_line = raw_line[:hash_pos]
             line = raw_line.strip()
 
-            # Пропускаем пустые строки и комментарии
-            if not line or line.startswith("#"):
-                continue
-
-            # Удаляем инлайн-комментарии (после #)
-            if "#" in line:
-                line = line[:line.index("#")].strip()
+            # Пропускаем пустые строки и строки-комментарии
             if not line:
                 continue
 
             # Новая секция?
-            m = self._RE_SECTION.match(line)
-            if m:
-                # Сохраняем предыдущую секцию
-                if current_section is not None:
-                    sections[current_section] = current_params
-
-                current_section = m.group(1).strip().lower()
-                current_params = {}
-                continue
-
-            # Параметр key : value
-            m = self._RE_PARAM.match(line)
-            if m and current_section is not None:
-                key = m.group(1).strip().lower()
-                value = m.group(2).strip()
+            if line[0] == "[":
+                m = self._RE_SECTION.match(line)
+                if m:
+                    # Сохраняем предыдущую секцию
+                    if current_section is not None:
+                        sections[current_section] = current_params
+
+                    current_section = m.group(1).strip().lower()
+                    current_params = {}
+                    continue
+
+            # Параметр key : value — пробелы вокруг двоеточия опциональны
+            key, sep, value = line.partition(":")
+            if sep and key and current_section is not None:
+                key = key.strip().lower()
+                value = value.strip()
                 # points могут теоретически продолжаться на следующей строке
                 if key == "points" and key in current_params:
                     current_params[key] += ", " + value
@@ -225,9 +265,12 @@ class FlashforgeMeshParser:
             "bed_mesh_profile_default"       ->  "default"
             "printer"                        ->  None
         """
-        for prefix in _MESH_PREFIXES:
-            if section_name.startswith(prefix):
-                name = section_name[len(prefix):]
+        # Одна проверка в C для всех префиксов; обычные секции отсекаются сразу
+        if not section_name.startswith(_MESH_PREFIXES):
+            return None
+        for prefix, prefix_len in zip(_MESH_PREFIXES, _PREFIX_LENS):
+            if section_name[:prefix_len] == prefix:
+                name = section_name[prefix_len:]
                 return name if name else "default"
         return None
 
@@ -246,26 +289,25 @@ class FlashforgeMeshParser:
             if not raw_points:
                 raise ValueError(f"Отсутствует поле 'points'")
 
-            flat: List[float] = [
-                float(v.strip())
-                for v in raw_points.split(",")
-                if v.strip()
-            ]
-            if not flat:
+            raw_points = raw_points.strip().strip(",")
+            if _RE_EMPTY_FIELDS.search(raw_points):
+                raw_points = _RE_EMPTY_FIELDS.sub(",", raw_points)
+            flat = _parse_points(raw_points)
+            if not flat.size:
                 raise ValueError("Пустой список points")
 
             # ── размер сетки ─────────────────────────────────
-            x_count, y_count = self._resolve_grid_size(profile_name, params, flat)
+            x_count, y_count = self._resolve_grid_size(profile_name, params, flat.size)
 
             expected = x_count * y_count
-            if expected != len(flat):
+            if expected != flat.size:
                 raise ValueError(
                     f"Несоответствие размера: {x_count}x{y_count}={expected} "
-                    f"не совпадает с количеством points={len(flat)}"
+                    f"не совпадает с количеством points={flat.size}"
                 )
 
             # ── формируем матрицу [y_count x x_count] ────────
-            matrix = np.array(flat, dtype=np.float64).reshape(y_count, x_count)
+            matrix = flat.reshape(y_count, x_count)
 
             # ── координаты сетки ─────────────────────────────
             min_x, min_y, max_x, max_y = self._resolve_bounds(params)
@@ -293,7 +335,7 @@ class FlashforgeMeshParser:
     def _resolve_grid_size(
         profile_name: str,
         params: Dict[str, str],
-        flat: List[float],
+        n_points: int,
     ) -> Tuple[int, int]:
         """
         Определяет размер сетки.
@@ -301,7 +343,7 @@ class FlashforgeMeshParser:
         Приоритет:
           1. x_count / y_count из параметров (могут называться mesh_x_pps и т.д. — нет,
              берём именно x_count / y_count)
-          2. isqrt(len(flat)) — карты всегда квадратные
+          2. isqrt(n_points) — карты всегда квадратные
         """
         x_str = params.get("x_count", "")
         y_str = params.get("y_count", "")
@@ -310,7 +352,7 @@ class FlashforgeMeshParser:
             return int(float(x_str)), int(float(y_str))
 
         # Автоопределение для квадратных карт
-        n = len(flat)
+        n = n_points
         side = math.isqrt(n)
         if side * side != n:
             raise ValueError(
@@ -332,10 +374,14 @@ class FlashforgeMeshParser:
         mesh_max = params.get("mesh_max", "")
 
         if mesh_min and mesh_max:
-            mn = [float(v.strip()) for v in mesh_min.split(",")]
-            mx = [float(v.strip()) for v in mesh_max.split(",")]
+            mn = _parse_points(mesh_min.strip())
+            mx = _parse_points(mesh_max.strip())
+            if mn.size < 2 or mx.size < 2:
+                raise ValueError(
+                    f"Некорректные mesh_min/mesh_max: '{mesh_min}' / '{mesh_max}'"
+                )
             # mesh_min/max — порядок X, Y
-            return mn[0], mn[1], mx[0], mx[1]
+            return float(mn[0]), float(mn[1]), float(mx[0]), float(mx[1])
 
         # Отдельные поля
         try:
@@ -4,10 +4,55 @@
 Модуль для интерполяции сетки стола для визуализации
 """
 
+import math
+from functools import lru_cache
+from typing import Tuple
+
 import numpy as np
 from scipy.interpolate import griddata, RectBivariateSpline
 
 
+@lru_cache(maxsize=16)
+def _evaluation_grid(x_count: int, y_count: int,
+                     target_points: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Точки оценки для сетки заданного размера
+    
+    Зависят только от (x_count, y_count, target_points), поэтому строятся один раз
+    и разделяются всеми интерполяторами. Массивы доступны только для чтения.
+    
+    Returns:
+        tuple: (x_new, y_new, X_new, Y_new)
+    """
+    x_new = np.linspace(0, x_count - 1, target_points)
+    y_new = np.linspace(0, y_count - 1, target_points)
+    X_new, Y_new = np.meshgrid(x_new, y_new)
+    for array in (x_new, y_new, X_new, Y_new):
+        array.setflags(write=False)
+    return x_new, y_new, X_new, Y_new
+
+
+@lru_cache(maxsize=16)
+def _griddata_grid(x_count: int, y_count: int,
+                   target_points: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Узлы исходной сетки и плотная сетка для griddata (только для чтения)
+    
+    Returns:
+        tuple: (points, grid_x, grid_y)
+    """
+    # Координаты узлов (i, j) построчно
+    ii, jj = np.mgrid[0:x_count, 0:y_count]
+    points = np.column_stack((ii.ravel(), jj.ravel()))
+    
+    # Новая, более плотная сетка для интерполяции
+    grid_x, grid_y = np.mgrid[0:x_count-0.01:complex(0, target_points), 
+                              0:y_count-0.01:complex(0, target_points)]
+    for array in (points, grid_x, grid_y):
+        array.setflags(write=False)
+    return points, grid_x, grid_y
+
+
 class MeshInterpolator:
     """Класс для интерполяции данных сетки стола"""
     
@@ -16,7 +61,8 @@ class MeshInterpolator:
         Инициализация интерполятора
         
         Args:
-            mesh_data: Исходные данные сетки
+            mesh_data: Исходные данные сетки, форма [x_count x y_count]
+                (первая ось — X, вторая — Y)
             x_count: Количество точек сетки по X
             y_count: Количество точек сетки по Y
         """
@@ -44,15 +90,14 @@ class MeshInterpolator:
         # Создаем интерполятор с помощью сплайнов
         interpolator = RectBivariateSpline(x, y, self.mesh_data, s=smooth)
         
-        # Создаем точки для интерполированной сетки
-        x_new = np.linspace(0, self.x_count - 1, target_points)
-        y_new = np.linspace(0, self.y_count - 1, target_points)
-        X_new, Y_new = np.meshgrid(x_new, y_new)
+        # Точки интерполированной сетки (общие для всех сеток того же размера)
+        x_new, y_new, X_new, Y_new = _evaluation_grid(self.x_count, self.y_count, target_points)
         
         # Получаем интерполированные значения
         Z_new = interpolator(x_new, y_new)
         
-        return X_new, Y_new, Z_new
+        # Общие сетки только для чтения: вызывающий код получает свои копии
+        return X_new.copy(), Y_new.copy(), Z_new
         
     def interpolate_grid(self, 
                         target_points: int = 100, 
@@ -67,27 +112,17 @@ class MeshInterpolator:
         Returns:
             tuple: (X_grid, Y_grid, Z_values) - сетка X-Y и значения Z для 3D визуализации
         """
-        # Создаем список координат точек и значений
-        points = []
-        values = []
+        # Узлы и плотная сетка (общие для всех сеток того же размера)
+        points, grid_x, grid_y = _griddata_grid(self.x_count, self.y_count, target_points)
         
-        for i in range(self.x_count):
-            for j in range(self.y_count):
-                points.append([i, j])
-                values.append(self.mesh_data[i, j])
-        
-        # Преобразуем в numpy arrays
-        points = np.array(points)
-        values = np.array(values)
-        
-        # Создаем новую, более плотную сетку для интерполяции
-        grid_x, grid_y = np.mgrid[0:self.x_count-0.01:complex(0, target_points), 
-                                 0:self.y_count-0.01:complex(0, target_points)]
+        # Значения mesh_data[i, j] построчно
+        values = np.asarray(self.mesh_data)[:self.x_count, :self.y_count].ravel()
         
         # Интерполируем значения на новой сетке
         grid_z = griddata(points, values, (grid_x, grid_y), method=method)
         
-        return grid_x, grid_y, grid_z
+        # Общие сетки только для чтения: вызывающий код получает свои копии
+        return grid_x.copy(), grid_y.copy(), grid_z
         
     def apply_smoothing(self, z_data: np.ndarray, alpha: float = 0.1) -> np.ndarray:
         """
@@ -100,14 +135,18 @@ class MeshInterpolator:
         Returns:
             np.ndarray: Сглаженные данные Z
         """
-        # Нормализуем данные для сглаживания
         z_min, z_max = np.nanmin(z_data), np.nanmax(z_data)
-        normalized_data = (z_data - z_min) / (z_max - z_min)
+        z_range = z_max - z_min
+        
+        # Нормализуем данные и сразу умножаем на alpha (один буфер на все шаги)
+        smoothed_data = np.subtract(z_data, z_min, dtype=np.float64)
+        smoothed_data *= alpha / z_range
         
         # Применяем экспоненциальное сглаживание
-        smoothed_data = np.exp(alpha * normalized_data) / np.exp(alpha)
+        np.exp(smoothed_data, out=smoothed_data)
         
         # Возвращаем к исходному диапазону
-        smoothed_data = smoothed_data * (z_max - z_min) + z_min
+        smoothed_data *= z_range / math.exp(alpha)
+        smoothed_data += z_min
         
         return smoothed_data
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""JSON encode/decode helpers that prefer orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+
+    def loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _HAS_ORJSON = True
+except Exception:  # noqa: BLE001
+
+    def loads(data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _HAS_ORJSON = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception regardless of the backend in use.
+JSONDecodeError = json.JSONDecodeError
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional, Tuple
+
+from ._json import loads
 
 
 def _merge_dict(base: dict, update: dict) -> dict:
@@ -15,11 +17,37 @@ def _merge_dict(base: dict, update: dict) -> dict:
     return base
 
 
+def _decode_catalogue(raw: bytes) -> Optional[dict]:
+    # JSONDecodeError and UnicodeDecodeError are both ValueErrors.
+    try:
+        return loads(raw)
+    except ValueError:
+        return None
+
+
+def _flatten(payload: dict, prefix: str = "") -> Iterator[Tuple[str, str]]:
+    for key, value in payload.items():
+        dotted = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{dotted}.")
+        else:
+            yield sys.intern(dotted), str(value)
+
+
 @dataclass
 class LanguageDefinition:
     code: str
     name: str
-    translations: Dict[str, object]
+    # Undecoded file contents, kept until the first use of the language;
+    # see LocalizationService._catalogue.
+    raw: Optional[bytes] = None
+    translations: Optional[Dict[str, object]] = None
+    flat: Optional[Dict[str, str]] = None
+
+    def populate(self, payload: dict) -> None:
+        self.raw = None
+        self.translations = {k: v for k, v in payload.items() if k != "_meta"}
+        self.flat = dict(_flatten(self.translations))
 
 
 class LocalizationService:
@@ -43,21 +71,32 @@ class LocalizationService:
         self._default_language = default_language
         self._languages: Dict[str, LanguageDefinition] = {}
         self._current_language: str = default_language
+        # Results for the current language, untranslated keys included; both
+        # caches are dropped by set_language. Plain keys skip building a tuple.
+        self._tr_cache: Dict[str, str] = {}
+        self._tcache: Dict[Tuple[str, str], str] = {}
         self._load_languages()
 
     def _load_languages(self) -> None:
         if not self._languages_dir.exists():
             self._languages_dir.mkdir(parents=True, exist_ok=True)
 
-        for file in self._languages_dir.glob("*.json"):
+        # Every file is read once here, but decoding is deferred to the first
+        # use of the language unless the display name sits in a _meta block.
+        for file in sorted(self._languages_dir.glob("*.json")):
             try:
-                payload = json.loads(file.read_text(encoding="utf-8"))
-                code = file.stem
-                name = payload.get("_meta", {}).get("name", code.upper())
-                translations = {k: v for k, v in payload.items() if k != "_meta"}
-                self._languages[code] = LanguageDefinition(code, name, translations)
-            except json.JSONDecodeError:
+                raw = file.read_bytes()
+            except OSError:
                 continue
+            code = file.stem
+            lang = LanguageDefinition(code, code.upper(), raw)
+            if b'"_meta"' in raw:
+                payload = _decode_catalogue(raw)
+                if payload is None:
+                    continue
+                lang.name = payload.get("_meta", {}).get("name", lang.name)
+                lang.populate(payload)
+            self._languages[code] = lang
 
         if self._default_language not in self._languages and self._languages:
             self._current_language = next(iter(self._languages))
@@ -73,28 +112,56 @@ class LocalizationService:
         if language_code not in self._languages:
             return False
         self._current_language = language_code
+        self._tr_cache.clear()
+        self._tcache.clear()
         return True
 
     def translate(self, key: str, default: Optional[str] = None) -> str:
-        return self._lookup(key, self._current_language, default)
+        if default is None:
+            value = self._tr_cache.get(key)
+            if value is None:
+                value = self._lookup(key, self._current_language, None)
+                self._tr_cache[key] = value
+            return value
+        cache_key = (key, default)
+        value = self._tcache.get(cache_key)
+        if value is None:
+            value = self._lookup(key, self._current_language, default)
+            self._tcache[cache_key] = value
+        return value
 
     def translate_from(self, language_code: str, key: str, default: Optional[str] = None) -> str:
         return self._lookup(key, language_code, default)
 
+    def _catalogue(self, lang: LanguageDefinition) -> Dict[str, str]:
+        if lang.flat is None:
+            payload = _decode_catalogue(lang.raw) if lang.raw else None
+            if payload is None:
+                self._drop_language(lang.code)
+                return {}
+            lang.populate(payload)
+        return lang.flat
+
+    def _drop_language(self, code: str) -> None:
+        # A malformed catalogue is skipped like one found at startup, only later.
+        del self._languages[code]
+        if self._current_language == code:
+            self._current_language = self._default_language
+            self._tr_cache.clear()
+            self._tcache.clear()
+
     def _lookup(self, key: str, language_code: str, default: Optional[str]) -> str:
-        parts = key.split(".")
         lang = self._languages.get(language_code)
         if not lang:
             return default or key
 
-        node: object = lang.translations
-        for part in parts:
-            if isinstance(node, dict) and part in node:
-                node = node[part]
-            else:
-                fallback = self._languages.get(self._default_language)
-                if fallback and language_code != self._default_language:
-                    return self._lookup(key, self._default_language, default)
-                return default or key
-        return str(node)
-
+        value = self._catalogue(lang).get(key)
+        if value is not None:
+            return value
+        if language_code != self._default_language:
+            fallback = self._languages.get(self._default_language)
+            if fallback:
+                value = self._catalogue(fallback).get(key)
+                if value is not None:
+                    return value
+        return default or key
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, field, asdict
+import atexit
+import os
+import threading
+from dataclasses import dataclass, field, fields, is_dataclass
 from pathlib import Path
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from ._json import JSONDecodeError, dumps, loads
 
 
 SETTINGS_PATH = Path("config") / "app_settings.json"
+SAVE_DEBOUNCE_SECONDS = 0.25
+
+
+@lru_cache(maxsize=None)
+def _field_names(dataclass_type: type) -> FrozenSet[str]:
+    return frozenset(f.name for f in fields(dataclass_type))
 
 
 @dataclass
@@ -88,7 +99,16 @@ class ApplicationSettings:
     active_thermal_preset: str | None = "ABS 100°C"
 
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
+        # Nested sections hold only primitives, so shallow copies are enough
+        # and avoid the recursive deep copy done by dataclasses.asdict.
+        data: Dict[str, Any] = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if is_dataclass(value):
+                value = vars(value).copy()
+            elif f.name == "thermal_presets":
+                value = [vars(preset).copy() for preset in value]
+            data[f.name] = value
         return data
 
     @classmethod
@@ -96,19 +116,21 @@ class ApplicationSettings:
 
         def merge_dataclass(dataclass_type, values):
             base = dataclass_type()
+            known = _field_names(dataclass_type)
             for key, value in values.items():
-                if hasattr(base, key):
+                if key in known:
                     setattr(base, key, value)
             return base
 
         instance = cls()
+        known_fields = _field_names(cls)
         for key, value in payload.items():
             if key in {"hardware", "thresholds", "visualization", "environment", "workflow", "ssh"}:
                 target_type = getattr(instance, key).__class__
                 setattr(instance, key, merge_dataclass(target_type, value))
             elif key == "thermal_presets" and isinstance(value, list):
                 instance.thermal_presets = [merge_dataclass(ThermalPreset, item) for item in value if isinstance(item, dict)]
-            elif hasattr(instance, key):
+            elif key in known_fields:
                 setattr(instance, key, value)
         if instance.active_thermal_preset is None and instance.thermal_presets:
             instance.active_thermal_preset = instance.thermal_presets[0].name
@@ -123,13 +145,19 @@ class SettingsService:
     def __init__(self, storage_path: Path = SETTINGS_PATH) -> None:
         self.storage_path = storage_path
         self.settings = ApplicationSettings()
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        # Settings serialized by schedule_save on the caller's thread; the timer
+        # only writes these bytes and never reads the live settings object.
+        self._pending_payload: Optional[bytes] = None
+        atexit.register(self.flush)
 
     def load(self) -> ApplicationSettings:
         if self.storage_path.exists():
             try:
-                payload = json.loads(self.storage_path.read_text(encoding="utf-8"))
+                payload = loads(self.storage_path.read_bytes())
                 self.settings = ApplicationSettings.from_dict(payload)
-            except json.JSONDecodeError:
+            except JSONDecodeError:
                 # Corrupted file, keep defaults but do not overwrite immediately.
                 pass
         else:
@@ -137,15 +165,47 @@ class SettingsService:
         return self.settings
 
     def save(self) -> None:
+        """Write settings to disk immediately, superseding any pending save."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._pending_payload = None
+            self._write(self._serialize())
+
+    def schedule_save(self) -> None:
+        """Coalesce bursts of changes into a single write shortly afterwards."""
+        payload = self._serialize()
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._pending_payload = payload
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write a pending debounced save, if any."""
+        with self._save_lock:
+            if self._save_timer is None:
+                return
+            self._save_timer.cancel()
+            self._save_timer = None
+            payload, self._pending_payload = self._pending_payload, None
+            self._write(payload)
+
+    def _serialize(self) -> bytes:
+        return dumps(self.settings.to_dict())
+
+    def _write(self, payload: bytes) -> None:
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-        self.storage_path.write_text(
-            json.dumps(self.settings.to_dict(), indent=2),
-            encoding="utf-8",
-        )
+        tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, self.storage_path)
 
     def update(self, **kwargs: Any) -> ApplicationSettings:
         for key, value in kwargs.items():
             if hasattr(self.settings, key):
                 setattr(self.settings, key, value)
-        self.save()
+        self.schedule_save()
         return self.settings
@@ -4,9 +4,11 @@ Application state container that bridges backend logic with UI views.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import copy
+from dataclasses import asdict, dataclass, replace
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import numpy as np
 
@@ -14,13 +16,21 @@ from calibration.algorithms.deviation_analyzer import DeviationAnalyzer
 from calibration.algorithms.screw_solver import ScrewConfig, ScrewSolver
 from calibration.algorithms.tape_calculator import TapeCalculator
 from calibration.hardware.bed import Bed, BedConfig
-from calibration.workflow import WorkflowData, compute_workflow
+from calibration.workflow import WorkflowData, compute_workflow, settings_key
 from data_processing.measurement_parser import KlipperMeshParser, MeshData
 
-from flashforge_app.services.settings import ApplicationSettings, SettingsService
+from flashforge_app.services.settings import (
+    ApplicationSettings,
+    EnvironmentSettings,
+    HardwareSettings,
+    SettingsService,
+    ThermalPreset,
+    ThresholdSettings,
+    WorkflowSettings,
+)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BedWorkspace:
     mesh: MeshData
     bed: Bed
@@ -33,6 +43,84 @@ class BedWorkspace:
     def mesh_matrix(self) -> np.ndarray:
         return self.bed.mesh_data if self.bed.mesh_data is not None else self.mesh.matrix
 
+    @property
+    def mesh_stats(self) -> Tuple[float, float]:
+        """Peak-to-peak deviation and mean height of the active mesh."""
+        return _mesh_stats(self.mesh_matrix)
+
+
+# Mesh arrays are swapped, never edited in place, so the last array object is
+# a safe key; holding it also keeps its id from being reused.
+_last_mesh_stats: Optional[Tuple[np.ndarray, Tuple[float, float]]] = None
+
+
+def _mesh_stats(matrix: np.ndarray) -> Tuple[float, float]:
+    global _last_mesh_stats
+    if _last_mesh_stats is not None and _last_mesh_stats[0] is matrix:
+        return _last_mesh_stats[1]
+    # Meshes are at most a few thousand points: the cost is call dispatch, not
+    # memory traffic, so the ndarray methods skip the np.max/np.min wrappers.
+    stats = (float(matrix.max() - matrix.min()), float(matrix.mean()))
+    _last_mesh_stats = (matrix, stats)
+    return stats
+
+
+# Centaur build plate size in mm.
+BED_SIZE_X = 220.0
+BED_SIZE_Y = 220.0
+
+
+@lru_cache(maxsize=8)
+def _make_screw_config(pitch: float, min_adjust: float, max_adjust: float) -> ScrewConfig:
+    # Shared between workspaces; the algorithms never mutate their configs.
+    return ScrewConfig(pitch=pitch, min_adjust=min_adjust, max_adjust=max_adjust)
+
+
+@lru_cache(maxsize=8)
+def _make_bed_config(mesh_points_x: int, mesh_points_y: int) -> BedConfig:
+    return BedConfig(
+        size_x=BED_SIZE_X,
+        size_y=BED_SIZE_Y,
+        mesh_points_x=mesh_points_x,
+        mesh_points_y=mesh_points_y,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class SettingsPayload:
+    """Immutable snapshot of the settings sections consumed by compute_workflow."""
+
+    hardware: HardwareSettings
+    thresholds: ThresholdSettings
+    interpolation_factor: int
+    workflow: WorkflowSettings
+    environment: EnvironmentSettings
+    thermal_model: Optional[ThermalPreset] = None
+
+    @classmethod
+    def from_settings(cls, settings: ApplicationSettings, preset: Optional[ThermalPreset]) -> "SettingsPayload":
+        # Sections are copied because the views edit settings in place.
+        return cls(
+            hardware=replace(settings.hardware),
+            thresholds=replace(settings.thresholds),
+            interpolation_factor=settings.visualization.interpolation_factor,
+            workflow=replace(settings.workflow),
+            environment=replace(settings.environment),
+            thermal_model=replace(preset) if preset is not None else None,
+        )
+
+    def as_mapping(self) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "hardware": asdict(self.hardware),
+            "thresholds": asdict(self.thresholds),
+            "visualization": {"interpolation_factor": self.interpolation_factor},
+            "workflow": asdict(self.workflow),
+            "environment": asdict(self.environment),
+        }
+        if self.thermal_model is not None:
+            payload["thermal_model"] = asdict(self.thermal_model)
+        return payload
+
 
 class AppState:
     """
@@ -47,6 +135,16 @@ class AppState:
         self.last_printer_cfg: Optional[Path] = None
         self.profiles: Dict[str, MeshData] = {}
         self.active_profile_name: Optional[str] = None
+        # compute_workflow payload, rebuilt only when the relevant settings change
+        self._payload_snapshot: Optional[SettingsPayload] = None
+        self._payload: Dict[str, Any] = {}
+        self._payload_key: Any = None
+        # Copy of the settings last passed to update_settings; the views edit
+        # the live object in place, so it cannot be compared with itself.
+        self._applied_settings: Optional[ApplicationSettings] = None
+        # Bumped for every workflow computation that is started; results of
+        # older generations are stale and dropped by apply_workflow.
+        self._workflow_generation = 0
 
     # ------------------------------------------------------------------ Settings helpers
     def reload_settings(self) -> ApplicationSettings:
@@ -57,54 +155,73 @@ class AppState:
         self.settings_service.save()
         self.current_settings = self.settings_service.settings
 
-    def update_settings(self, settings: ApplicationSettings) -> None:
+    def update_settings(self, settings: ApplicationSettings, *, recompute: bool = True) -> bool:
+        """
+        Apply edited settings to the active workspace.
+
+        With ``recompute=False`` the workflow is only cleared, leaving the
+        caller to run it (e.g. on a worker thread via workflow_job).
+        Returns False when nothing changed since the last call.
+        """
         self.settings_service.settings = settings
         self.current_settings = settings
-        self.save_settings()
-        if self.workspace:
+        if settings == self._applied_settings:
+            return False
+        self._applied_settings = copy.deepcopy(settings)
+        # Settings panels call this in bursts; coalesce the disk writes.
+        self.settings_service.schedule_save()
+        workspace = self.workspace
+        if workspace:
             hw = settings.hardware
             thresholds = settings.thresholds
-            screw_config = ScrewConfig(
-                pitch=hw.screw_pitch,
-                min_adjust=hw.min_adjustment,
-                max_adjust=hw.max_adjustment,
-            )
-
-            self.workspace.screw_solver.set_screw_config(screw_config)
-            self.workspace.analyzer.set_screw_config(screw_config)
-            self.workspace.analyzer.set_corner_averaging_size(hw.corner_averaging)
-            self.workspace.analyzer.screw_threshold = thresholds.screw_threshold
-            self.workspace.analyzer.tape_threshold = thresholds.tape_threshold
-            self.workspace.tape_calculator.tape_thickness = hw.tape_thickness
-            self.workspace.tape_calculator.min_height_diff = thresholds.tape_threshold
-            self._compute_workflow()
+            screw_config = _make_screw_config(hw.screw_pitch, hw.min_adjustment, hw.max_adjustment)
+
+            analyzer = workspace.analyzer
+            tape_calculator = workspace.tape_calculator
+            workspace.screw_solver.set_screw_config(screw_config)
+            analyzer.set_screw_config(screw_config)
+            analyzer.set_corner_averaging_size(hw.corner_averaging)
+            analyzer.screw_threshold = thresholds.screw_threshold
+            analyzer.tape_threshold = thresholds.tape_threshold
+            tape_calculator.tape_thickness = hw.tape_thickness
+            tape_calculator.min_height_diff = thresholds.tape_threshold
+            if recompute:
+                self._compute_workflow()
+            else:
+                self._workflow_generation += 1
+                self.workspace = replace(workspace, workflow=None)
+        return True
 
     # ------------------------------------------------------------------ Bed handling
+    def _parse_printer_config(self, file_path: Path) -> Dict[str, MeshData]:
+        # Stray non-UTF-8 bytes (e.g. in comments) must not block the mesh data.
+        content = file_path.read_bytes().decode("utf-8", errors="replace")
+        return self.parser.parse_config_file(content)
+
     def load_printer_config(self, file_path: Path) -> BedWorkspace:
-        content = Path(file_path).read_text(encoding="utf-8")
-        profiles = self.parser.parse_config_file(content)
+        profiles = self._parse_printer_config(file_path)
         if not profiles:
             raise ValueError("failed_to_parse_mesh")
         self.profiles = profiles
         self.active_profile_name = next(iter(profiles))
         mesh = profiles[self.active_profile_name]
 
-        bed = Bed(BedConfig(
-            size_x=220.0,
-            size_y=220.0,
-            mesh_points_x=mesh.x_count,
-            mesh_points_y=mesh.y_count,
-        ))
+        self.workspace = self._build_workspace(mesh)
+        self.last_printer_cfg = file_path
+        self.current_settings.last_file = str(file_path)
+        self.settings_service.save()
+
+        self._compute_workflow()
+        return self.workspace
+
+    def _build_workspace(self, mesh: MeshData) -> BedWorkspace:
+        bed = Bed(_make_bed_config(mesh.x_count, mesh.y_count))
         bed.set_mesh_data(mesh.matrix)
 
         hw = self.current_settings.hardware
         thresholds = self.current_settings.thresholds
 
-        screw_config = ScrewConfig(
-            pitch=hw.screw_pitch,
-            min_adjust=hw.min_adjustment,
-            max_adjust=hw.max_adjustment,
-        )
+        screw_config = _make_screw_config(hw.screw_pitch, hw.min_adjustment, hw.max_adjustment)
 
         analyzer = DeviationAnalyzer(
             bed,
@@ -120,20 +237,13 @@ class AppState:
             min_height_diff=thresholds.tape_threshold,
         )
 
-        self.workspace = BedWorkspace(
+        return BedWorkspace(
             mesh=mesh,
             bed=bed,
             analyzer=analyzer,
             screw_solver=screw_solver,
             tape_calculator=tape_calculator,
         )
-        self.last_printer_cfg = file_path
-        self.current_settings.last_file = str(file_path)
-        self.settings_service.save()
-
-        self._compute_workflow()
-        return self.workspace
-
 
     def switch_profile(self, profile_name: str) -> Optional[BedWorkspace]:
         """Переключить активную карту меша без перечитывания файла."""
@@ -142,103 +252,98 @@ class AppState:
         self.active_profile_name = profile_name
         mesh = self.profiles[profile_name]
 
-        hw = self.current_settings.hardware
-        thresholds = self.current_settings.thresholds
-        screw_config = ScrewConfig(
-            pitch=hw.screw_pitch,
-            min_adjust=hw.min_adjustment,
-            max_adjust=hw.max_adjustment,
-        )
-        bed = Bed(BedConfig(
-            size_x=220.0,
-            size_y=220.0,
-            mesh_points_x=mesh.x_count,
-            mesh_points_y=mesh.y_count,
-        ))
-        bed.set_mesh_data(mesh.matrix)
-        analyzer = DeviationAnalyzer(
-            bed,
-            corner_averaging_size=hw.corner_averaging,
-            screw_threshold=thresholds.screw_threshold,
-            tape_threshold=thresholds.tape_threshold,
-            screw_config=screw_config,
-        )
-        screw_solver = ScrewSolver(bed, screw_config)
-        tape_calculator = TapeCalculator(
-            bed,
-            tape_thickness=hw.tape_thickness,
-            min_height_diff=thresholds.tape_threshold,
-        )
-        self.workspace = BedWorkspace(
-            mesh=mesh,
-            bed=bed,
-            analyzer=analyzer,
-            screw_solver=screw_solver,
-            tape_calculator=tape_calculator,
-        )
+        # Bed, analyzer and solvers depend only on the grid size and settings,
+        # so a profile with the same grid just swaps the mesh in place.
+        workspace = self.workspace
+        if (
+            workspace is not None
+            and workspace.mesh.x_count == mesh.x_count
+            and workspace.mesh.y_count == mesh.y_count
+        ):
+            workspace.bed.set_mesh_data(mesh.matrix)
+            workspace.analyzer.invalidate(corner=True)
+            self.workspace = replace(workspace, mesh=mesh, workflow=None)
+            self._compute_workflow()
+            return self.workspace
+
+        self.workspace = self._build_workspace(mesh)
         self._compute_workflow()
         return self.workspace
 
-    def _compute_workflow(self) -> Optional[WorkflowData]:
-        if not self.workspace:
+    def _active_thermal_preset(self) -> Optional[ThermalPreset]:
+        settings = self.current_settings
+        presets = settings.thermal_presets
+        if not presets:
             return None
-        settings_payload = {
-            "hardware": {
-                "tape_thickness": self.current_settings.hardware.tape_thickness,
-                "belt_tooth_mm": self.current_settings.hardware.belt_tooth_mm,
-                "screw_pitch": self.current_settings.hardware.screw_pitch,
-                "min_adjustment": self.current_settings.hardware.min_adjustment,
-                "max_adjustment": self.current_settings.hardware.max_adjustment,
-                "corner_averaging": self.current_settings.hardware.corner_averaging,
-            },
-            "thresholds": {
-                "belt_threshold": self.current_settings.thresholds.belt_threshold,
-                "screw_threshold": self.current_settings.thresholds.screw_threshold,
-                "tape_threshold": self.current_settings.thresholds.tape_threshold,
-            },
-            "visualization": {
-                "interpolation_factor": self.current_settings.visualization.interpolation_factor,
-            },
-            "workflow": {
-                "enable_belt": self.current_settings.workflow.enable_belt,
-                "enable_screws": self.current_settings.workflow.enable_screws,
-                "enable_tape": self.current_settings.workflow.enable_tape,
-            },
-            "environment": {
-                "measurement_temp": self.current_settings.environment.measurement_temp,
-                "target_temp": self.current_settings.environment.target_temp,
-                "thermal_expansion_coeff": self.current_settings.environment.thermal_expansion_coeff,
-            },
-        }
-        presets = self.current_settings.thermal_presets
-        active_preset = None
-        if presets:
-            active_preset = next(
-                (preset for preset in presets if preset.name == self.current_settings.active_thermal_preset),
-                presets[0],
-            )
-            settings_payload["thermal_model"] = {
-                "name": active_preset.name,
-                "measurement_temp": active_preset.measurement_temp,
-                "target_temp": active_preset.target_temp,
-                "chamber_factor": active_preset.chamber_factor,
-                "pei_thickness": active_preset.pei_thickness,
-                "steel_thickness": active_preset.steel_thickness,
-                "alpha_pei": active_preset.alpha_pei,
-                "alpha_steel": active_preset.alpha_steel,
-                "beta_uniform": active_preset.beta_uniform,
-            }
-        self.workspace.workflow = compute_workflow(
-            self.workspace.bed,
-            self.workspace.analyzer,
-            self.workspace.screw_solver,
-            self.workspace.tape_calculator,
+        active_name = settings.active_thermal_preset
+        return next(
+            (preset for preset in presets if preset.name == active_name),
+            presets[0],
+        )
+
+    def _settings_payload(self) -> Dict[str, Any]:
+        """Return the compute_workflow settings payload, reusing it while inputs are unchanged."""
+        snapshot = SettingsPayload.from_settings(self.current_settings, self._active_thermal_preset())
+        if snapshot != self._payload_snapshot:
+            self._payload_snapshot = snapshot
+            self._payload = snapshot.as_mapping()
+            self._payload_key = settings_key(self._payload)
+        return self._payload
+
+    def workflow_job(self, *, detached: bool = False) -> Optional[Tuple[int, Callable[[], WorkflowData]]]:
+        """
+        Capture the compute_workflow inputs for the active workspace.
+
+        Returns ``(generation, job)``; the result is handed back through
+        apply_workflow. Pass ``detached=True`` when ``job`` runs on another
+        thread: it then gets its own copies of the bed and solvers, since the
+        GUI thread keeps editing the workspace ones in place.
+        """
+        workspace = self.workspace
+        if not workspace:
+            return None
+        inputs = (workspace.bed, workspace.analyzer, workspace.screw_solver, workspace.tape_calculator)
+        if detached:
+            # Mesh arrays are swapped, never edited in place, so the copies share it.
+            matrix = workspace.bed.mesh_data
+            inputs = copy.deepcopy(inputs, {id(matrix): matrix})
+        bed, analyzer, screw_solver, tape_calculator = inputs
+        settings_payload = self._settings_payload()
+        # Solvers of disabled stages are not handed over, so their settings
+        # do not affect the workflow cache key.
+        flags = self.current_settings.workflow
+        job = partial(
+            compute_workflow,
+            bed,
+            analyzer if flags.enable_screws else None,
+            screw_solver if flags.enable_belt or flags.enable_screws else None,
+            tape_calculator if flags.enable_tape else None,
             settings_payload,
+            frozen_settings=self._payload_key,
         )
-        # Attach active thermal preset for UI consumers
-        if self.workspace.workflow:
-            setattr(self.workspace.workflow, "active_thermal_model", settings_payload.get("thermal_model"))
-        return self.workspace.workflow
+        self._workflow_generation += 1
+        return self._workflow_generation, job
+
+    def apply_workflow(self, generation: int, workflow: WorkflowData) -> bool:
+        """Store a computed workflow unless a newer computation was started meanwhile."""
+        workspace = self.workspace
+        if workspace is None or generation != self._workflow_generation:
+            return False
+        self.workspace = replace(workspace, workflow=workflow)
+        return True
+
+    def is_current_workflow(self, generation: int) -> bool:
+        """Whether ``generation`` is the most recently started workflow computation."""
+        return generation == self._workflow_generation
+
+    def _compute_workflow(self) -> Optional[WorkflowData]:
+        pending = self.workflow_job()
+        if pending is None:
+            return None
+        generation, job = pending
+        workflow = job()
+        self.apply_workflow(generation, workflow)
+        return workflow
 
     def recompute_workflow(self) -> Optional[WorkflowData]:
         return self._compute_workflow()
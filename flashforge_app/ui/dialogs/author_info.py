@@ -1,24 +1,44 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
+from typing import ClassVar, Optional, Tuple
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt, QThreadPool
+from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import QDialog, QDialogButtonBox, QLabel, QVBoxLayout
 
 from flashforge_app.services.localization import LocalizationService
 
+_ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets" / "images"
+_EASTER_EGG_PATH = _ASSETS_DIR / "author_easter_egg.webp"
+_EASTER_EGG_EXISTS = _EASTER_EGG_PATH.is_file()
+_EASTER_EGG_SIZE = 360
+
+
+def _decode_easter_egg() -> Optional[QImage]:
+    # QImage, unlike QPixmap, may be built outside the GUI thread.
+    image = QImage(str(_EASTER_EGG_PATH))
+    if image.isNull():
+        return None
+    return image.scaled(_EASTER_EGG_SIZE, _EASTER_EGG_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
 
 class AuthorDialog(QDialog):
     """Informational dialog with author details and a small easter egg."""
 
     _TARGET_CLICKS = 15
+    # Kept per process: once found, the easter egg stays revealed in later dialogs.
+    _total_clicks: ClassVar[int] = 0
+    _image_loaded: ClassVar[bool] = False
+    # Decoded and scaled once (see preload_easter_egg), then shared by every dialog instance.
+    _preload_started: ClassVar[bool] = False
+    _cached_image: ClassVar[Optional[QImage]] = None
+    _cached_pixmap: ClassVar[Optional[QPixmap]] = None
 
     def __init__(self, localization: LocalizationService, parent=None) -> None:
         super().__init__(parent)
         self.localization = localization
-        self._clicks = 0
-        self._image_loaded = False
 
         self.setWindowTitle(self.localization.translate("neo_ui.author.title"))
         self.setModal(True)
@@ -28,10 +48,9 @@ class AuthorDialog(QDialog):
         layout.setContentsMargins(24, 20, 24, 20)
         layout.setSpacing(12)
 
-        nickname = self.localization.translate("neo_ui.author.nickname")
-        message_text = self.localization.translate("neo_ui.author.message")
-        hyperlink = f"<a href='author'>{nickname}</a>"
-        message_html = message_text.replace(nickname, hyperlink)
+        _, message_html, self._revealed_text = self._build_message_html(
+            self.localization, self.localization.current_language
+        )
 
         self.message_label = QLabel(message_html)
         self.message_label.setWordWrap(True)
@@ -50,25 +69,51 @@ class AuthorDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+        if AuthorDialog._image_loaded:
+            self._show_easter_egg()
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _build_message_html(localization: LocalizationService, language: str) -> Tuple[str, str, str]:
+        """Return (nickname, message_html, revealed_text) for the given language."""
+        nickname = localization.translate_from(language, "neo_ui.author.nickname")
+        message_text = localization.translate_from(language, "neo_ui.author.message")
+        message_html = message_text.format(nickname_link=f"<a href='author'>{nickname}</a>")
+        revealed_text = localization.translate_from(language, "neo_ui.author.message_revealed")
+        return nickname, message_html, revealed_text
+
+    @classmethod
+    def preload_easter_egg(cls) -> None:
+        """Decode and scale the easter egg image on a pool thread ahead of time."""
+        if cls._preload_started or not _EASTER_EGG_EXISTS:
+            return
+        cls._preload_started = True
+
+        def _load() -> None:
+            cls._cached_image = _decode_easter_egg()
+
+        QThreadPool.globalInstance().start(_load)
+
     def _handle_nickname_click(self) -> None:
-        if self._image_loaded:
+        cls = type(self)
+        if cls._image_loaded:
             return
-        self._clicks += 1
-        if self._clicks >= self._TARGET_CLICKS:
+        cls._total_clicks += 1
+        if cls._total_clicks >= cls._TARGET_CLICKS:
             self._show_easter_egg()
 
     def _show_easter_egg(self) -> None:
-        self._image_loaded = True
-        image_path = (
-            Path(__file__).resolve().parent.parent / "assets" / "images" / "author_easter_egg.webp"
-        )
-        if image_path.exists():
-            pixmap = QPixmap(str(image_path))
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(360, 360, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.image_label.setPixmap(scaled)
-                self.image_label.setVisible(True)
+        AuthorDialog._image_loaded = True
+        scaled = AuthorDialog._cached_pixmap
+        if scaled is None and _EASTER_EGG_EXISTS:
+            # Falls back to decoding here if the preload has not finished yet.
+            image = AuthorDialog._cached_image or _decode_easter_egg()
+            if image is not None:
+                scaled = QPixmap.fromImage(image)
+                AuthorDialog._cached_pixmap = scaled
+                AuthorDialog._cached_image = None
+        if scaled is not None:
+            self.image_label.setPixmap(scaled)
+            self.image_label.setVisible(True)
         # subtly update the caption to acknowledge the discovery
-        self.message_label.setText(
-            self.localization.translate("neo_ui.author.message_revealed")
-        )
+        self.message_label.setText(self._revealed_text)
@@ -10,26 +10,32 @@ animated visualizers from ``visualization.bed_mesh.animated_recommendations``.
 from __future__ import annotations
 
 import html
-from typing import Iterable, Optional
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Optional
 
 import numpy as np
-from matplotlib import animation
+from contourpy import LineType, contour_generator
+from matplotlib.collections import LineCollection
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
-from mpl_toolkits.axes_grid1.inset_locator import inset_axes
+from matplotlib.transforms import Bbox
 
-from PySide6.QtCore import Qt, QSize, QTimer
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QRectF, QSize, Qt, QTimer
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPalette, QPen
 from PySide6.QtWidgets import (
     QDialog,
     QFrame,
     QGridLayout,
     QHBoxLayout,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QPushButton,
     QScrollArea,
     QSizePolicy,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTextEdit,
     QVBoxLayout,
     QWidget,
@@ -40,13 +46,224 @@ from calibration.workflow import StageAction, StageResult, WorkflowData
 
 from flashforge_app.services.localization import LocalizationService
 from flashforge_app.services.settings import ApplicationSettings
-from visualization.bed_mesh.animated_recommendations import (
-    ScrewAdjustmentVisualizer,
-    TapeCell,
-    TapeLayoutVisualizer,
+
+if TYPE_CHECKING:
+    # Анимации и визуализаторы импортируются при первом построении фигуры,
+    # а не при загрузке модуля вместе с главным окном
+    from matplotlib import animation
+
+    from visualization.bed_mesh.animated_recommendations import ScrewAdjustmentVisualizer
+
+
+# Направление поворота винта из текстового описания действия
+_DIR_MAP: dict[str, RotationDirection] = {
+    "clockwise": RotationDirection.CLOCKWISE,
+    "down": RotationDirection.CLOCKWISE,
+    "cw": RotationDirection.CLOCKWISE,
+    "counterclockwise": RotationDirection.COUNTERCLOCKWISE,
+    "up": RotationDirection.COUNTERCLOCKWISE,
+    "ccw": RotationDirection.COUNTERCLOCKWISE,
+}
+
+@lru_cache(maxsize=16)
+def _axis_labels(rows: int, cols: int) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Подписи осей сетки: буквы столбцов и номера строк снизу вверх."""
+    return tuple(chr(65 + c) for c in range(cols)), tuple(str(rows - r) for r in range(rows))
+
+
+@lru_cache(maxsize=16)
+def _temperature_axes(
+    rows: int, cols: int, half_x: float, half_y: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, tuple[str, ...], tuple[str, ...]]:
+    """
+    Оси температурной карты в миллиметрах: узлы сетки, позиции и подписи делений.
+
+    Массивы общие для всех вызовов, поэтому доступны только для чтения.
+    """
+    x_axis = np.linspace(-half_x, half_x, cols)
+    y_axis = np.linspace(-half_y, half_y, rows)
+    x_ticks = np.linspace(-half_x, half_x, min(cols, 7))
+    y_ticks = np.linspace(-half_y, half_y, min(rows, 7))
+    for array in (x_axis, y_axis, x_ticks, y_ticks):
+        array.flags.writeable = False
+    return (
+        x_axis,
+        y_axis,
+        x_ticks,
+        y_ticks,
+        tuple(f"{tick:.0f}" for tick in x_ticks),
+        tuple(f"{tick:.0f}" for tick in y_ticks),
+    )
+
+
+# Идентификатор точки сетки: номер строки и буква столбца ("9H"), допускается и "H9"
+_GRID_IDENTIFIER_RE = re.compile(r"^(?:(\d+)([A-Za-z])|([A-Za-z])(\d+))$")
+
+
+@lru_cache(maxsize=32)
+def _anchor_mapping(rows: int, cols: int) -> dict[str, tuple[int, int]]:
+    """Узлы сетки для именованных углов и валов (не изменять: словарь общий)."""
+    return {
+        "front_left": (0, 0),
+        "front_right": (0, cols - 1),
+        "back_left": (rows - 1, 0),
+        "back_right": (rows - 1, cols - 1),
+        "back": (rows - 1, cols // 2),
+        "back_center": (rows - 1, cols // 2),
+    }
+
+
+# Параметры тепловой модели на случай, если в расчете их нет; температуры
+# берутся из настроек окружения
+_THERMAL_DEFAULTS: dict[str, object] = {
+    "name": "",
+    "chamber_factor": 0.0,
+    "pei_thickness": 0.55,
+    "steel_thickness": 1.50,
+    "alpha_pei": 5.0e-5,
+    "alpha_steel": 1.2e-5,
+    "beta_uniform": 0.2,
+}
+
+_ACTION_CARD_STYLE = (
+    "QFrame#ActionCard { border: 1px solid #3B82F6; border-radius: 4px; background: rgba(59, 130, 246, 0.1); }"
 )
 
 
+class ActionCard(QFrame):
+    """Карточка действия этапа: заголовок и строка с деталями."""
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setObjectName("ActionCard")
+        self.setStyleSheet(_ACTION_CARD_STYLE)
+        layout = QVBoxLayout()
+        layout.setContentsMargins(8, 6, 8, 6)
+        layout.setSpacing(3)
+        self.setLayout(layout)
+
+        self.title_label = QLabel()
+        self.title_label.setStyleSheet("font-weight: 600; font-size: 12px;")
+        layout.addWidget(self.title_label)
+
+        self.details_label = QLabel()
+        self.details_label.setWordWrap(True)
+        self.details_label.setStyleSheet("font-size: 11px;")
+        layout.addWidget(self.details_label)
+
+    def set_action(self, title: str, details: str) -> None:
+        self.title_label.setText(title)
+        self.details_label.setText(details)
+
+
+class _ActionListModel(QAbstractListModel):
+    """Действия этапа для виртуализированного списка: (заголовок, детали) в Qt.DisplayRole."""
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._rows: list[tuple[str, str]] = []
+
+    def set_rows(self, rows: Iterable[tuple[str, str]]) -> None:
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()]
+        if role == Qt.ToolTipRole:
+            return self._rows[index.row()][1]
+        return None
+
+
+class ActionCardDelegate(QStyledItemDelegate):
+    """Рисует карточку действия напрямую через QPainter, без дочерних виджетов."""
+
+    _BORDER = QColor("#3B82F6")
+    _BACKGROUND = QColor(59, 130, 246, 26)
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._title_font = QFont()
+        self._title_font.setPixelSize(12)
+        self._title_font.setWeight(QFont.DemiBold)
+        self._details_font = QFont()
+        self._details_font.setPixelSize(11)
+        self._details_metrics = QFontMetrics(self._details_font)
+        self._title_height = QFontMetrics(self._title_font).height()
+
+    @staticmethod
+    def _row_width(option: QStyleOptionViewItem) -> int:
+        # Строка занимает всю ширину списка, детали переносятся по словам
+        view = option.widget
+        if isinstance(view, QListView):
+            return view.viewport().width() - 2 * view.spacing()
+        return option.rect.width()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        _, details = index.data(Qt.DisplayRole)
+        width = self._row_width(option)
+        details_height = self._details_metrics.boundingRect(
+            0, 0, max(width - 16, 1), 0, Qt.AlignLeft | Qt.TextWordWrap, details
+        ).height()
+        # поля 6 px сверху и снизу и 3 px между строками, как у ActionCard
+        return QSize(width, 6 + self._title_height + 3 + details_height + 6)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        title, details = index.data(Qt.DisplayRole)
+        rect = QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(self._BORDER, 1))
+        painter.setBrush(self._BACKGROUND)
+        painter.drawRoundedRect(rect, 4, 4)
+
+        painter.setPen(option.palette.color(QPalette.Text))
+        text_rect = option.rect.adjusted(8, 6, -8, -6)
+        painter.setFont(self._title_font)
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignTop | Qt.TextSingleLine, title)
+        painter.setFont(self._details_font)
+        details_rect = text_rect.adjusted(0, self._title_height + 3, 0, 0)
+        painter.drawText(details_rect, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, details)
+        painter.restore()
+
+
+class _StageListModel(QAbstractListModel):
+    """Строки списка этапов: текст для отображения и сам StageResult (Qt.UserRole)."""
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._rows: list[tuple[str, StageResult]] = []
+
+    def set_rows(self, rows: Iterable[tuple[str, StageResult]]) -> None:
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def stage(self, row: int) -> Optional[StageResult]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row][1]
+        return None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        text, stage = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == Qt.UserRole:
+            return stage
+        return None
+
+
 class VisualRecommendationsDialog(QDialog):
     """
     Диалог визуальных рекомендаций с оптимизированной компоновкой:
@@ -56,6 +273,12 @@ class VisualRecommendationsDialog(QDialog):
     • Улучшенная анимация винтов (как в референсе)
     """
 
+    _FIGURE_CACHE_SIZE = 8
+    # Начиная с этого количества действия рисуются делегатом в QListView
+    _VIRTUAL_ACTIONS_THRESHOLD = 6
+    # Изолинии температурной карты, общие для всех экземпляров диалога
+    _isoline_cache: "OrderedDict[tuple, tuple[list[np.ndarray], Optional[list[np.ndarray]]]]" = OrderedDict()
+
     def __init__(
         self,
         localization: LocalizationService,
@@ -71,18 +294,32 @@ class VisualRecommendationsDialog(QDialog):
         self.theme = theme
         self.show_minutes = bool(settings.visualization.show_minutes)
         self.show_degrees = bool(settings.visualization.show_degrees)
+        self._screw_mode = settings.hardware.screw_mode
 
         self._current_animation: Optional[animation.FuncAnimation] = None
-        self._qt_anim_timer: Optional[QTimer] = None
+        # Собственный таймер matplotlib текущей анимации (запускается первой отрисовкой)
+        self._anim_event_source = None
+        # Один таймер на диалог; шагает ту анимацию, которая сейчас показана
+        self._anim_timer = QTimer(self)
+        self._anim_timer.setInterval(120)
+        self._anim_timer.timeout.connect(self._tick_animation)
         self.figure_canvas: Optional[FigureCanvasQTAgg] = None
+        self._pending_figure_stage: Optional[StageResult] = None
+        self._figure_cache: "OrderedDict[tuple, tuple[FigureCanvasQTAgg, Optional[animation.FuncAnimation]]]" = OrderedDict()
+        self._mesh_cache: dict[int, np.ndarray] = {}
+        self._visualizer_cache: dict[tuple, ScrewAdjustmentVisualizer] = {}
+        self._hints_html_cache: dict[tuple, str] = {}
+        self._action_rows_cache: dict[tuple, tuple[tuple[str, str], ...]] = {}
+        self._last_label_text: dict[str, str] = {}
+        self._best_stage_cache: Optional[tuple[WorkflowData, Optional[StageResult]]] = None
 
         self.setWindowTitle(self.localization.translate("neo_ui.visual.title"))
         self.resize(1100, 720)
 
         self._build_ui()
         self._populate_stage_list()
-        if self.stage_list.count():
-            self.stage_list.setCurrentRow(0)
+        # Первый этап (и его фигура) выбирается уже после показа диалога
+        QTimer.singleShot(0, self._select_first_stage)
 
     # ------------------------------------------------------------------ UI construction
     def _build_ui(self) -> None:
@@ -98,12 +335,18 @@ class VisualRecommendationsDialog(QDialog):
         root.addLayout(body, stretch=1)
 
         # Stage list (узкий)
-        self.stage_list = QListWidget()
+        # Все строки этапов двухстрочные, поэтому высоту достаточно измерить один раз
+        self.stage_model = _StageListModel(self)
+        self.stage_list = QListView()
         self.stage_list.setObjectName("Card")
         self.stage_list.setFixedWidth(260)
         self.stage_list.setSpacing(3)
-        self.stage_list.setSelectionMode(QListWidget.SingleSelection)
-        self.stage_list.currentRowChanged.connect(self._handle_stage_changed)
+        self.stage_list.setUniformItemSizes(True)
+        self.stage_list.setSelectionMode(QListView.SingleSelection)
+        self.stage_list.setModel(self.stage_model)
+        self.stage_list.selectionModel().currentRowChanged.connect(
+            lambda current, _previous: self._handle_stage_changed(current.row())
+        )
         body.addWidget(self.stage_list, 0)
 
         # Details panel - расширяемый
@@ -214,13 +457,37 @@ class VisualRecommendationsDialog(QDialog):
         actions_scroll.setFrameStyle(QFrame.NoFrame)
         actions_scroll.setMaximumHeight(300)
         actions_container.addWidget(actions_scroll)
-
-        actions_widget = QWidget()
+        self.actions_scroll = actions_scroll
+
+        # Длинные списки действий (например, скотч) рисуются делегатом без виджетов
+        self.actions_model = _ActionListModel(self)
+        self.actions_view = QListView()
+        self.actions_view.setFrameShape(QFrame.NoFrame)
+        self.actions_view.setMaximumHeight(300)
+        self.actions_view.setSpacing(3)
+        # Высота строки зависит от переноса деталей: пересчитываем при изменении ширины
+        self.actions_view.setResizeMode(QListView.Adjust)
+        self.actions_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.actions_view.setSelectionMode(QListView.NoSelection)
+        self.actions_view.setFocusPolicy(Qt.NoFocus)
+        self.actions_view.setItemDelegate(ActionCardDelegate(self.actions_view))
+        self.actions_view.setModel(self.actions_model)
+        self.actions_view.hide()
+        actions_container.addWidget(self.actions_view)
+
+        self.actions_widget = QWidget()
         self.actions_layout = QVBoxLayout()
         self.actions_layout.setContentsMargins(0, 0, 0, 0)
         self.actions_layout.setSpacing(6)
-        actions_widget.setLayout(self.actions_layout)
-        actions_scroll.setWidget(actions_widget)
+        self.actions_widget.setLayout(self.actions_layout)
+        actions_scroll.setWidget(self.actions_widget)
+
+        self.actions_empty_label = QLabel(self.localization.translate("neo_ui.visual.no_actions"))
+        self.actions_empty_label.setObjectName("Caption")
+        self.actions_empty_label.hide()
+        self.actions_layout.addWidget(self.actions_empty_label)
+        self.actions_layout.addStretch(1)
+        self._action_cards: list[ActionCard] = []
 
         # Hints - справа
         hints_container = QVBoxLayout()
@@ -251,8 +518,8 @@ class VisualRecommendationsDialog(QDialog):
     # ------------------------------------------------------------------ header
     # ------------------------------------------------------------------ stages
     def _populate_stage_list(self) -> None:
-        self.stage_list.clear()
         tr = self.localization.translate
+        rows: list[tuple[str, StageResult]] = []
         best = self._best_stage()
         for stage in self.workflow.stages:
             if stage.key == "initial":
@@ -264,30 +531,41 @@ class VisualRecommendationsDialog(QDialog):
             deviation = f"{stage.deviation:.3f} mm"
             if best and stage.key == best.key:
                 label = f"★ {label}"
-            item = QListWidgetItem(f"{label}\n{deviation}")
-            item.setData(Qt.UserRole, stage)
-            size = item.sizeHint()
-            item.setSizeHint(QSize(size.width(), size.height() + 8))
-            self.stage_list.addItem(item)
+            rows.append((f"{label}\n{deviation}", stage))
+        self.stage_model.set_rows(rows)
+
+    def _select_first_stage(self) -> None:
+        if self.stage_model.rowCount() and not self.stage_list.currentIndex().isValid():
+            self.stage_list.setCurrentIndex(self.stage_model.index(0))
 
     def _handle_stage_changed(self, row: int) -> None:
-        item = self.stage_list.item(row)
-        if not item:
+        stage = self.stage_model.stage(row)
+        if stage is None:
             return
-        stage: StageResult = item.data(Qt.UserRole)
         self._display_stage(stage)
 
     def _display_stage(self, stage: StageResult) -> None:
         tr = self.localization.translate
-        self.stage_title_label.setText(tr(stage.label))
-        self.stage_description_label.setText(self._stage_description(stage))
+        self._set_label_text("title", self.stage_title_label, tr(stage.label))
+        self._set_label_text("description", self.stage_description_label, self._stage_description(stage))
 
         self._update_metrics(stage)
         self._update_stage_meta(stage)
         self._render_warnings(stage)
-        self._render_actions(stage.actions)
+        self._render_actions(self._action_rows(stage))
         self._render_hints(stage)
-        self._render_stage_figure(stage)
+
+        # Фигура строится в следующем цикле событий, после отрисовки текста этапа;
+        # при быстром переключении строится только последняя выбранная
+        self._detach_figure()
+        self._pending_figure_stage = stage
+        QTimer.singleShot(0, self._render_pending_figure)
+
+    def _render_pending_figure(self) -> None:
+        stage = self._pending_figure_stage
+        self._pending_figure_stage = None
+        if stage is not None:
+            self._render_stage_figure(stage)
 
     # ------------------------------------------------------------------ metrics & warnings
     def _update_metrics(self, stage: StageResult) -> None:
@@ -302,18 +580,29 @@ class VisualRecommendationsDialog(QDialog):
         if baseline is not None:
             improvement = baseline - deviation
 
-        self.metric_widgets["deviation"].setText(_fmt(deviation))
-        self.metric_widgets["baseline"].setText(_fmt(baseline))
         if improvement is not None:
             sign = "+" if improvement >= 0 else ""
-            self.metric_widgets["improvement"].setText(f"{sign}{improvement:.3f} mm")
+            improvement_text = f"{sign}{improvement:.3f} mm"
         else:
-            self.metric_widgets["improvement"].setText("—")
+            improvement_text = "—"
+        for key, text in (
+            ("deviation", _fmt(deviation)),
+            ("baseline", _fmt(baseline)),
+            ("improvement", improvement_text),
+        ):
+            self._set_label_text(key, self.metric_widgets[key], text)
+
+    def _set_label_text(self, key: str, label: QLabel, text: str) -> None:
+        """Обновляет текст метки только если он изменился с прошлого этапа."""
+        if self._last_label_text.get(key) == text:
+            return
+        self._last_label_text[key] = text
+        label.setText(text)
 
     def _update_stage_meta(self, stage: StageResult) -> None:
         if stage.key != "after_temperature":
             self.stage_meta_label.hide()
-            self.stage_meta_label.clear()
+            self._set_label_text("meta", self.stage_meta_label, "")
             return
 
         tr = self.localization.translate
@@ -363,7 +652,7 @@ class VisualRecommendationsDialog(QDialog):
             delta_tpl.format(delta_through=delta_through, delta_uniform=delta_uniform),
             curvature_tpl.format(kappa=kappa_total, warp=warp_half, warp_range=warp_range),
         ]
-        self.stage_meta_label.setText("<br>".join(html.escape(line) for line in lines))
+        self._set_label_text("meta", self.stage_meta_label, "<br>".join(html.escape(line) for line in lines))
         self.stage_meta_label.show()
 
     def _render_warnings(self, stage: StageResult) -> None:
@@ -377,136 +666,217 @@ class VisualRecommendationsDialog(QDialog):
             self.warning_label.hide()
 
     # ------------------------------------------------------------------ actions & hints
-    def _render_actions(self, actions: Iterable[StageAction]) -> None:
-        self._clear_layout(self.actions_layout)
-        actions = list(actions)
-        tr = self.localization.translate
-        if not actions:
-            empty = QLabel(tr("neo_ui.visual.no_actions"))
-            empty.setObjectName("Caption")
-            self.actions_layout.addWidget(empty)
-            self.actions_layout.addStretch(1)
+    def _action_rows(self, stage: StageResult) -> tuple[tuple[str, str], ...]:
+        """Заголовок и описание каждого действия; форматируются один раз на этап и язык."""
+        key = (stage.key, id(stage), self.localization.current_language)
+        rows = self._action_rows_cache.get(key)
+        if rows is None:
+            tr = self.localization.translate
+            rows = tuple((tr(action.label), self._format_action(action)) for action in stage.actions)
+            self._action_rows_cache[key] = rows
+        return rows
+
+    def _render_actions(self, actions: tuple[tuple[str, str], ...]) -> None:
+        if len(actions) >= self._VIRTUAL_ACTIONS_THRESHOLD:
+            self.actions_model.set_rows(actions)
+            self.actions_scroll.hide()
+            self.actions_view.show()
             return
+        self.actions_view.hide()
+        self.actions_model.set_rows(())
+        self.actions_scroll.show()
 
-        for action in actions:
-            frame = QFrame()
-            frame.setObjectName("ActionCard")
-            frame.setStyleSheet(
-                "QFrame#ActionCard { border: 1px solid #3B82F6; border-radius: 4px; background: rgba(59, 130, 246, 0.1); }"
-            )
-            layout = QVBoxLayout()
-            layout.setContentsMargins(8, 6, 8, 6)
-            layout.setSpacing(3)
-            frame.setLayout(layout)
-
-            title = QLabel(tr(action.label))
-            title.setStyleSheet("font-weight: 600; font-size: 12px;")
-            layout.addWidget(title)
-
-            details = QLabel(self._format_action(action))
-            details.setWordWrap(True)
-            details.setStyleSheet("font-size: 11px;")
-            layout.addWidget(details)
-
-            self.actions_layout.addWidget(frame)
+        cards = self._action_cards
 
-        self.actions_layout.addStretch(1)
+        # Карточки переиспользуются между этапами; перерисовка - один раз в конце
+        self.actions_widget.setUpdatesEnabled(False)
+        try:
+            self.actions_empty_label.setVisible(not actions)
+            while len(cards) < len(actions):
+                card = ActionCard()
+                # перед растяжкой в конце layout
+                self.actions_layout.insertWidget(self.actions_layout.count() - 1, card)
+                cards.append(card)
+            for card, (title, details) in zip(cards, actions):
+                card.set_action(title, details)
+                card.show()
+            for card in cards[len(actions):]:
+                card.hide()
+        finally:
+            self.actions_widget.setUpdatesEnabled(True)
 
     def _render_hints(self, stage: StageResult) -> None:
-        hints = self._stage_hints(stage)
-        if hints:
-            html_text = "<ul style='margin: 0; padding-left: 20px;'>"
-            for line in hints:
-                html_text += f"<li style='margin-bottom: 4px;'>{html.escape(line)}</li>"
-            html_text += "</ul>"
-        else:
-            html_text = self.localization.translate("neo_ui.visual.hints.instructions_short")
+        # Подсказки зависят только от этапа и языка, HTML собирается один раз
+        key = (stage.key, id(stage), self.localization.current_language)
+        html_text = self._hints_html_cache.get(key)
+        if html_text is None:
+            hints = self._stage_hints(stage)
+            if hints:
+                html_text = (
+                    "<ul style='margin: 0; padding-left: 20px;'>"
+                    + "".join(f"<li style='margin-bottom: 4px;'>{html.escape(line)}</li>" for line in hints)
+                    + "</ul>"
+                )
+            else:
+                html_text = self.localization.translate("neo_ui.visual.hints.instructions_short")
+            self._hints_html_cache[key] = html_text
         self.hints_text.setHtml(html_text)
 
     # ------------------------------------------------------------------ figures
     def _render_stage_figure(self, stage: StageResult) -> None:
-        self._clear_figure()
-        fig: Optional[Figure] = None
-        animator: Optional[animation.FuncAnimation] = None
-
-        if stage.key == "after_screws":
-            fig, animator = self._build_screw_figure(stage)
-        elif stage.key == "after_belts":
-            fig, animator = self._build_belt_figure(stage)
-        elif stage.key == "after_tape":
-            fig = self._build_tape_figure(stage)
-        elif stage.mesh is not None:
-            fig = self._build_heatmap(stage)
-
-        if fig is None:
-            self.figure_placeholder.show()
-            return
-
-        self.figure_canvas = FigureCanvasQTAgg(fig)
-        self.figure_canvas.setStyleSheet("background: transparent;")
-        self.figure_canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.figure_frame.layout().addWidget(self.figure_canvas)
+        self._detach_figure()
+
+        # Фигуры строятся один раз на этап; повторный выбор только показывает canvas
+        key = (stage.key, id(stage))
+        cached = self._figure_cache.get(key)
+        if cached is not None:
+            self._figure_cache.move_to_end(key)
+            canvas, animator = cached
+            canvas.show()
+        else:
+            fig: Optional[Figure] = None
+            animator = None
+
+            if stage.key == "after_screws":
+                fig, animator = self._build_screw_figure(stage)
+            elif stage.key == "after_belts":
+                fig, animator = self._build_belt_figure(stage)
+            elif stage.key == "after_tape":
+                fig = self._build_tape_figure(stage)
+            elif stage.mesh is not None:
+                fig = self._build_heatmap(stage)
+
+            if fig is None:
+                self.figure_placeholder.show()
+                return
+
+            canvas = FigureCanvasQTAgg(fig)
+            canvas.setStyleSheet("background: transparent;")
+            canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            self.figure_frame.layout().addWidget(canvas)
+            if animator:
+                self._enable_blitting(canvas, animator)
+            self._cache_figure(key, canvas, animator)
+
+        self.figure_canvas = canvas
         self.figure_placeholder.hide()
 
         # Сохраняем анимацию
         self._current_animation = animator
+        self._anim_event_source = animator.event_source if animator else None
         if animator:
-            # КРИТИЧНО: подключаем анимацию к canvas через _draw_event
-            def on_draw(_event) -> None:
-                pass
-
-            self.figure_canvas.mpl_connect("draw_event", on_draw)
             QTimer.singleShot(100, lambda: self._start_animation(animator))
 
+    def _cache_figure(
+        self,
+        key: tuple,
+        canvas: FigureCanvasQTAgg,
+        animator: Optional[animation.FuncAnimation],
+    ) -> None:
+        self._figure_cache[key] = (canvas, animator)
+        while len(self._figure_cache) > self._FIGURE_CACHE_SIZE:
+            _, (old_canvas, _) = self._figure_cache.popitem(last=False)
+            old_canvas.setParent(None)
+            old_canvas.deleteLater()
+
+    @staticmethod
+    def _enable_blitting(canvas: FigureCanvasQTAgg, animator: animation.FuncAnimation) -> None:
+        """
+        Blitting: статичный фон рисуется один раз (и после каждого полного
+        перерисовывания, например при resize), кадр обновляет только дуги.
+        На экран копируется лишь область, которую дуги могут затронуть.
+        """
+        fig = canvas.figure
+        artists = list(getattr(fig, "animated_artists", None) or ())
+        if not artists:
+            return
+        background = None
+        dirty = fig.bbox
+
+        def capture_background(_event) -> None:
+            nonlocal background, dirty
+            background = canvas.copy_from_bbox(fig.bbox)
+            renderer = canvas.get_renderer()
+            for artist in artists:
+                fig.draw_artist(artist)
+            # Клинья обрезаются по своим осям, подписи неподвижны, поэтому
+            # грязная область постоянна до следующей полной перерисовки
+            dirty = Bbox.union(
+                [
+                    artist.axes.bbox
+                    if artist.axes is not None and artist.get_clip_on()
+                    else artist.get_window_extent(renderer)
+                    for artist in artists
+                ]
+            ).padded(2)
+
+        def blit_frame(_framedata, _blit) -> None:
+            if background is None:
+                canvas.draw_idle()
+                return
+            canvas.restore_region(background)
+            for artist in artists:
+                fig.draw_artist(artist)
+            canvas.blit(dirty)
+
+        for artist in artists:
+            artist.set_animated(True)
+        canvas.mpl_connect("draw_event", capture_background)
+        animator._post_draw = blit_frame  # type: ignore[attr-defined]
+
     def _start_animation(self, animator: animation.FuncAnimation) -> None:
-        """Запускает анимацию после того как canvas отрисован."""
-        if not animator or not self.figure_canvas:
+        """Запускает (или перезапускает) анимацию после того как canvas отрисован."""
+        if not animator or animator is not self._current_animation or not self.figure_canvas:
             return
         try:
-            original_update = animator._func  # type: ignore[attr-defined]
-            canvas = self.figure_canvas
+            # Повторный показ закэшированной фигуры начинает анимацию сначала
+            animator.frame_seq = animator.new_frame_seq()  # type: ignore[attr-defined]
 
             # Выполняем первый кадр до старта, чтобы клин стал видимым
             try:
-                original_update(1)
+                animator._func(1)  # type: ignore[attr-defined]
             except Exception:
                 pass
-
-            def patched_update(frame):
-                result = original_update(frame)
-                canvas.draw_idle()
-                return result
-
-            animator._func = patched_update  # type: ignore[attr-defined]
             self.figure_canvas.draw()
 
-            # Переводим управление таймером в Qt, чтобы гарантировать обновление
-            if self._qt_anim_timer:
-                self._qt_anim_timer.stop()
-                self._qt_anim_timer.deleteLater()
-            interval = 120
-            native_timer = getattr(animator, "event_source", None)
-            if native_timer is not None:
-                try:
-                    interval = int(native_timer.interval)
-                    native_timer.stop()
-                except Exception:
-                    pass
-            self._qt_anim_timer = QTimer(self)
-            self._qt_anim_timer.setInterval(max(30, interval))
-
-            def step_animation() -> None:
-                try:
-                    animator._step()  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-
-            self._qt_anim_timer.timeout.connect(step_animation)
-            self._qt_anim_timer.start()
-            step_animation()
+            # Переводим управление в общий таймер диалога, чтобы гарантировать обновление
+            if self._anim_event_source is not None:
+                self._anim_event_source.stop()
+            # Интервал берем из самой анимации: таймер matplotlib после первого
+            # повтора переключается на repeat_delay
+            interval = int(getattr(animator, "_interval", 120) or 120)
+            self._anim_timer.setInterval(max(30, interval))
+            self._anim_timer.start()
+            self._tick_animation()
         except (AttributeError, RuntimeError):
             pass
 
+    def _tick_animation(self) -> None:
+        animator = self._current_animation
+        if animator is None or self.figure_canvas is None or not self.figure_canvas.isVisible():
+            return
+        try:
+            animator._step()  # type: ignore[attr-defined]
+        except Exception:
+            pass
+
+    def _screw_visualizer(self) -> ScrewAdjustmentVisualizer:
+        """Общий визуализатор для этапов винтов и валов."""
+        key = (self.theme, self.show_minutes, self.show_degrees, self.settings.hardware.screw_mode)
+        visualizer = self._visualizer_cache.get(key)
+        if visualizer is None:
+            from visualization.bed_mesh.animated_recommendations import ScrewAdjustmentVisualizer
+
+            visualizer = ScrewAdjustmentVisualizer(
+                translator=self.localization.translate,
+                is_dark_theme=self.theme == "dark",
+                show_minutes=self.show_minutes,
+                show_degrees=self.show_degrees,
+                screw_mode=self.settings.hardware.screw_mode,
+            )
+            self._visualizer_cache[key] = visualizer
+        return visualizer
+
     def _build_screw_figure(self, stage: StageResult) -> tuple[Optional[Figure], Optional[animation.FuncAnimation]]:
         """Построение анимированной фигуры винтов (как в референсе)."""
         adjustments: dict[str, tuple[float, RotationDirection]] = {}
@@ -520,27 +890,17 @@ class VisualRecommendationsDialog(QDialog):
             if minutes is None:
                 continue
 
-            direction = RotationDirection.COUNTERCLOCKWISE
-            if action.direction:
-                dir_lower = action.direction.lower()
-                if dir_lower in {"clockwise", "down", "cw"}:
-                    direction = RotationDirection.CLOCKWISE
-                elif dir_lower in {"counterclockwise", "up", "ccw"}:
-                    direction = RotationDirection.COUNTERCLOCKWISE
-
+            direction = (
+                _DIR_MAP.get(action.direction.lower(), RotationDirection.COUNTERCLOCKWISE)
+                if action.direction
+                else RotationDirection.COUNTERCLOCKWISE
+            )
             adjustments[action.identifier] = (abs(float(minutes)), direction)
 
         if not adjustments:
             return None, None
 
-        visualizer = ScrewAdjustmentVisualizer(
-            translator=self.localization.translate,
-            is_dark_theme=self.theme == "dark",
-            show_minutes=self.show_minutes,
-            show_degrees=self.show_degrees,
-            screw_mode=self.settings.hardware.screw_mode,
-        )
-
+        visualizer = self._screw_visualizer()
         fig = visualizer.create_adjustment_figure(adjustments)
         fig.set_size_inches(11, 8)
         fig.set_dpi(100)
@@ -568,14 +928,7 @@ class VisualRecommendationsDialog(QDialog):
         if not adjustments:
             return None, None
 
-        visualizer = ScrewAdjustmentVisualizer(
-            translator=self.localization.translate,
-            is_dark_theme=self.theme == "dark",
-            show_minutes=self.show_minutes,
-            show_degrees=self.show_degrees,
-            screw_mode=self.settings.hardware.screw_mode,
-        )
-
+        visualizer = self._screw_visualizer()
         fig = visualizer.create_belt_animation_figure(adjustments)
         fig.set_size_inches(11, 8)
         fig.set_dpi(100)
@@ -586,6 +939,8 @@ class VisualRecommendationsDialog(QDialog):
         if stage.mesh is None:
             return None
 
+        from visualization.bed_mesh.animated_recommendations import TapeCell, TapeLayoutVisualizer
+
         cells: list[TapeCell] = []
         for action in stage.actions:
             identifier = action.identifier or ""
@@ -609,7 +964,7 @@ class VisualRecommendationsDialog(QDialog):
             is_dark_theme=self.theme == "dark",
         )
         fig = visualizer.create_tape_figure(
-            np.array(stage.mesh, dtype=float),
+            self._mesh_as_array(stage),
             cells,
             threshold_mm=tape_threshold,
             tape_thickness=tape_thickness,
@@ -618,17 +973,22 @@ class VisualRecommendationsDialog(QDialog):
         if fig:
             fig.set_size_inches(11, 8)
             fig.set_dpi(100)
-            fig.tight_layout(pad=0.5)
+            fig.set_layout_engine("constrained", w_pad=0.02, h_pad=0.02)
 
         return fig
 
     def _build_heatmap(self, stage: StageResult) -> Optional[Figure]:
         if stage.mesh is None:
             return None
-        data = np.array(stage.mesh, dtype=float)
+        data = self._mesh_as_array(stage)
         rows, cols = data.shape
+        # Строки сетки идут снизу вверх; переворот - это view без копирования,
+        # общий для imshow и изолиний
+        flipped = data[::-1]
 
-        fig = Figure(figsize=(11, 8), dpi=100)
+        # Constrained layout считается во время отрисовки, отдельный проход tight_layout не нужен
+        fig = Figure(figsize=(11, 8), dpi=100, layout="constrained")
+        fig.get_layout_engine().set(w_pad=0.02, h_pad=0.02)
         fig.patch.set_alpha(0.0)
         ax = fig.add_subplot(111)
         ax.set_facecolor("none")
@@ -642,12 +1002,10 @@ class VisualRecommendationsDialog(QDialog):
             bed_y = float(info.get("bed_size_y", rows))
             half_x = bed_x / 2.0
             half_y = bed_y / 2.0
-            x_axis = np.linspace(-half_x, half_x, cols)
-            y_axis = np.linspace(-half_y, half_y, rows)
+            x_axis, y_axis, x_ticks, y_ticks, x_labels, y_labels = _temperature_axes(rows, cols, half_x, half_y)
             extent = (-half_x, half_x, -half_y, half_y)
-            heatmap_data = np.flipud(data)
             im = ax.imshow(
-                heatmap_data,
+                flipped,
                 cmap="coolwarm_r",
                 interpolation="bilinear",
                 origin="lower",
@@ -655,36 +1013,26 @@ class VisualRecommendationsDialog(QDialog):
                 aspect="equal",
             )
 
-            x_ticks = np.linspace(-half_x, half_x, min(cols, 7))
-            y_ticks = np.linspace(-half_y, half_y, min(rows, 7))
             ax.set_xticks(x_ticks)
             ax.set_yticks(y_ticks)
-            ax.set_xticklabels([f"{tick:.0f}" for tick in x_ticks], color=text_color, fontsize=11)
-            ax.set_yticklabels([f"{tick:.0f}" for tick in y_ticks], color=text_color, fontsize=11)
+            ax.set_xticklabels(x_labels, color=text_color, fontsize=11)
+            ax.set_yticklabels(y_labels, color=text_color, fontsize=11)
             ax.set_xlabel("X offset (mm)", color=text_color, fontsize=11)
             ax.set_ylabel("Y offset (mm)", color=text_color, fontsize=11)
             ax.set_xlim(-half_x, half_x)
             ax.set_ylim(-half_y, half_y)
 
-            Xg, Yg = np.meshgrid(x_axis, np.linspace(-half_y, half_y, rows))
-            levels = np.linspace(np.min(data), np.max(data), 9)
-            ax.contour(
-                Xg,
-                Yg,
-                np.flipud(data),
-                levels=levels,
-                colors="#64748B",
-                linewidths=0.6,
-                alpha=0.6,
+            # Изолинии: один проход contourpy и по одному LineCollection на стиль
+            # вместо ContourSet с отдельным artist на каждый уровень
+            segments, zero_lines = self._temperature_isolines(x_axis, y_axis, flipped)
+            ax.add_collection(
+                LineCollection(segments, colors="#64748B", linewidths=0.6, alpha=0.6),
+                autolim=False,
             )
-            if np.min(data) <= 0.0 <= np.max(data):
-                ax.contour(
-                    Xg,
-                    Yg,
-                    np.flipud(data),
-                    levels=[0.0],
-                    colors="#2563EB",
-                    linewidths=1.2,
+            if zero_lines is not None:
+                ax.add_collection(
+                    LineCollection(zero_lines, colors="#2563EB", linewidths=1.2),
+                    autolim=False,
                 )
 
             # annotate center and corners
@@ -714,17 +1062,19 @@ class VisualRecommendationsDialog(QDialog):
             ax.set_aspect('equal')
             ax.grid(which="both", linestyle=":", linewidth=0.6, color="#94A3B8", alpha=0.3)
         else:
-            flipped = np.flipud(data)
             im = ax.imshow(flipped, cmap="coolwarm_r", aspect="equal", interpolation="bilinear")
             ax.set_xlim(-0.5, cols - 0.5)
             ax.set_ylim(rows - 0.5, -0.5)
             ax.set_xticks(range(cols))
             ax.set_yticks(range(rows))
-            ax.set_xticklabels([chr(65 + c) for c in range(cols)], color=text_color, fontsize=12)
-            ax.set_yticklabels([str(rows - r) for r in range(rows)], color=text_color, fontsize=12)
+            x_labels, y_labels = _axis_labels(rows, cols)
+            ax.set_xticklabels(x_labels, color=text_color, fontsize=12)
+            ax.set_yticklabels(y_labels, color=text_color, fontsize=12)
             ax.grid(which="both", linestyle=":", linewidth=0.8, color="#64748B", alpha=0.4)
 
         # Используем встроенную ось для шкалы, чтобы карта оставалась по центру
+        from mpl_toolkits.axes_grid1.inset_locator import inset_axes
+
         cax = inset_axes(ax, width="3%", height="75%", loc="center right", borderpad=1.2)
         colorbar = fig.colorbar(im, cax=cax)
         colorbar.ax.tick_params(labelsize=10, colors=text_color)
@@ -752,48 +1102,137 @@ class VisualRecommendationsDialog(QDialog):
         self._annotate_heatmap_actions(ax, stage, data.shape, text_color)
 
         ax.set_title(title_text, color=text_color, fontsize=15, fontweight="bold", pad=12)
-        fig.tight_layout(pad=0.5)
         return fig
 
+    @classmethod
+    def _temperature_isolines(
+        cls, x_axis: np.ndarray, y_axis: np.ndarray, flipped: np.ndarray
+    ) -> tuple[list[np.ndarray], Optional[list[np.ndarray]]]:
+        """
+        Геометрия изолиний температурной карты в координатах данных.
+
+        Слой не зависит от темы и размера окна, поэтому кэшируется между
+        диалогами по содержимому сетки: повторное открытие не вызывает contourpy.
+        """
+        key = (flipped.shape, flipped.tobytes(), float(x_axis[-1]), float(y_axis[-1]))
+        cached = cls._isoline_cache.get(key)
+        if cached is not None:
+            cls._isoline_cache.move_to_end(key)
+            return cached
+
+        data_min = float(np.min(flipped))
+        data_max = float(np.max(flipped))
+        contours = contour_generator(
+            x_axis, y_axis, flipped, name="mpl2014", line_type=LineType.SeparateCode
+        )
+        segments = [
+            line
+            for level in np.linspace(data_min, data_max, 9)
+            for line in contours.lines(level)[0]
+        ]
+        zero_lines = contours.lines(0.0)[0] if data_min <= 0.0 <= data_max else None
+
+        cls._isoline_cache[key] = (segments, zero_lines)
+        while len(cls._isoline_cache) > cls._FIGURE_CACHE_SIZE:
+            cls._isoline_cache.popitem(last=False)
+        return segments, zero_lines
+
     # ------------------------------------------------------------------ helpers
-    def closeEvent(self, event) -> None:  # type: ignore[override]
+    def update_workflow(self, workflow: WorkflowData, settings: ApplicationSettings) -> None:
+        """
+        Переиспользует открытый ранее диалог для нового показа.
+
+        Если расчет и параметры отображения не изменились, кэши этапов
+        сохраняются и заново показывается выбранный этап; иначе кэши
+        сбрасываются и список этапов строится заново.
+        """
+        self.settings = settings
+        # Подсказки строятся по порогам и параметрам из settings, которые
+        # могли поменяться между показами даже при том же расчете
+        self._hints_html_cache.clear()
+        show_minutes = bool(settings.visualization.show_minutes)
+        show_degrees = bool(settings.visualization.show_degrees)
+        if (
+            workflow is self.workflow
+            and show_minutes == self.show_minutes
+            and show_degrees == self.show_degrees
+            and settings.hardware.screw_mode == self._screw_mode
+        ):
+            stage = self.stage_model.stage(self.stage_list.currentIndex().row())
+            if stage is not None:
+                self._display_stage(stage)
+            return
+
+        self.workflow = workflow
+        self.show_minutes = show_minutes
+        self.show_degrees = show_degrees
+        self._screw_mode = settings.hardware.screw_mode
+        self._reset_stage_caches()
+        self._populate_stage_list()
+        QTimer.singleShot(0, self._select_first_stage)
+
+    def _reset_stage_caches(self) -> None:
+        self._detach_figure()
+        self._pending_figure_stage = None
+        while self._figure_cache:
+            _, (canvas, _) = self._figure_cache.popitem(last=False)
+            canvas.setParent(None)
+            canvas.deleteLater()
+        self._mesh_cache.clear()
+        self._hints_html_cache.clear()
+        self._action_rows_cache.clear()
+
+    def hideEvent(self, event) -> None:  # type: ignore[override]
+        # Диалог переиспользуется: скрытый не должен крутить анимацию
         self._stop_animation()
-        super().closeEvent(event)
+        super().hideEvent(event)
+
+    def _mesh_as_array(self, stage: StageResult) -> np.ndarray:
+        """Сетка этапа как float64 без лишней копии (массив только читается)."""
+        cached = self._mesh_cache.get(id(stage))
+        if cached is None:
+            cached = np.asarray(stage.mesh, dtype=np.float64)
+            self._mesh_cache[id(stage)] = cached
+        return cached
 
     def _stop_animation(self) -> None:
-        if self._current_animation and getattr(self._current_animation, "event_source", None):
-            try:
-                self._current_animation.event_source.stop()
-            except (AttributeError, RuntimeError):
-                pass
+        if self._anim_event_source is not None:
+            self._anim_event_source.stop()
+            self._anim_event_source = None
         self._current_animation = None
-        if self._qt_anim_timer:
-            self._qt_anim_timer.stop()
-            self._qt_anim_timer.deleteLater()
-            self._qt_anim_timer = None
+        self._anim_timer.stop()
 
-    def _clear_figure(self) -> None:
+    def _detach_figure(self) -> None:
+        """Скрывает текущий canvas; сама фигура остается в кэше этапов."""
         self._stop_animation()
         if self.figure_canvas:
-            self.figure_canvas.setParent(None)
-            self.figure_canvas.deleteLater()
+            self.figure_canvas.hide()
             self.figure_canvas = None
         self.figure_placeholder.show()
 
     def _best_stage(self) -> Optional[StageResult]:
-        actionable = [
-            stage
-            for stage in self.workflow.stages
-            if stage.key != "initial" and stage.enabled and stage.actions
-        ]
-        if actionable:
-            return min(actionable, key=lambda st: st.deviation)
-        candidates = [
-            stage for stage in self.workflow.stages if stage.key != "initial" and stage.enabled
-        ]
-        if candidates:
-            return min(candidates, key=lambda st: st.deviation)
-        return next((st for st in self.workflow.stages if st.key != "initial"), None)
+        # Один проход по этапам на расчет; результат живет, пока диалог показывает этот workflow
+        if self._best_stage_cache is not None and self._best_stage_cache[0] is self.workflow:
+            return self._best_stage_cache[1]
+
+        best_actionable: Optional[StageResult] = None
+        best_candidate: Optional[StageResult] = None
+        first: Optional[StageResult] = None
+        for stage in self.workflow.stages:
+            if stage.key == "initial":
+                continue
+            if first is None:
+                first = stage
+            if not stage.enabled:
+                continue
+            if best_candidate is None or stage.deviation < best_candidate.deviation:
+                best_candidate = stage
+            if stage.actions and (best_actionable is None or stage.deviation < best_actionable.deviation):
+                best_actionable = stage
+
+        best = best_actionable or best_candidate or first
+        self._best_stage_cache = (self.workflow, best)
+        return best
 
     def _stage_description(self, stage: StageResult) -> str:
         tr = self.localization.translate
@@ -916,14 +1355,18 @@ class VisualRecommendationsDialog(QDialog):
 
     def _annotate_heatmap_actions(self, ax, stage: StageResult, shape: tuple[int, int], text_color: str) -> None:
         rows, cols = shape
+        xs: list[int] = []
+        ys: list[int] = []
+        colors: list[str] = []
         for action in stage.actions:
             coords = self._resolve_identifier(action.identifier, rows, cols)
             if not coords:
                 continue
             r, c = coords
             r = rows - 1 - r  # account for flipped heatmap
-            color = "#F59E0B" if action.kind == "tape" else "#F97316"
-            ax.scatter([c], [r], s=130, c=color, edgecolors="black", linewidths=1.6, zorder=3, alpha=0.9)
+            xs.append(c)
+            ys.append(r)
+            colors.append("#F59E0B" if action.kind == "tape" else "#F97316")
             ax.text(
                 c,
                 r - 0.35,
@@ -935,60 +1378,38 @@ class VisualRecommendationsDialog(QDialog):
                 color=text_color,
                 zorder=4,
             )
-
-    @staticmethod
-    def _clear_layout(layout: QVBoxLayout) -> None:
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+        if xs:
+            # Все маркеры одной коллекцией вместо отдельного scatter на действие
+            ax.scatter(xs, ys, s=130, c=colors, edgecolors="black", linewidths=1.6, zorder=3, alpha=0.9)
 
     def _active_thermal_model(self) -> dict[str, float]:
-        model = dict(getattr(self.workflow, "active_thermal_model", None) or {})
+        model = getattr(self.workflow, "active_thermal_model", None) or {}
         env = self.settings.environment
-        defaults = {
-            "name": model.get("name", ""),
-            "measurement_temp": model.get("measurement_temp", env.measurement_temp),
-            "target_temp": model.get("target_temp", env.target_temp),
-            "chamber_factor": model.get("chamber_factor", 0.0),
-            "pei_thickness": model.get("pei_thickness", 0.55),
-            "steel_thickness": model.get("steel_thickness", 1.50),
-            "alpha_pei": model.get("alpha_pei", 5.0e-5),
-            "alpha_steel": model.get("alpha_steel", 1.2e-5),
-            "beta_uniform": model.get("beta_uniform", 0.2),
-        }
+        defaults = {**_THERMAL_DEFAULTS, **model}
+        defaults.setdefault("measurement_temp", env.measurement_temp)
+        defaults.setdefault("target_temp", env.target_temp)
         if not defaults["name"]:
             defaults["name"] = self.localization.translate("temperature_preset_custom")
         return defaults
 
     @staticmethod
     def _parse_grid_identifier(identifier: str) -> Optional[tuple[int, int]]:
-        numeric = "".join(ch for ch in identifier if ch.isdigit())
-        alpha = "".join(ch for ch in identifier if ch.isalpha())
-        if not numeric or not alpha:
-            return None
-        try:
-            row = int(numeric) - 1
-            col = ord(alpha.upper()) - 65
-        except ValueError:
+        match = _GRID_IDENTIFIER_RE.match(identifier)
+        if not match:
             return None
-        if row < 0 or col < 0:
+        numeric = match.group(1) or match.group(4)
+        alpha = match.group(2) or match.group(3)
+        row = int(numeric) - 1
+        col = ord(alpha.upper()) - 65
+        if row < 0:
             return None
         return row, col
 
     @staticmethod
     def _resolve_identifier(identifier: str, rows: int, cols: int) -> Optional[tuple[int, int]]:
-        mapping = {
-            "front_left": (0, 0),
-            "front_right": (0, cols - 1),
-            "back_left": (rows - 1, 0),
-            "back_right": (rows - 1, cols - 1),
-            "back": (rows - 1, cols // 2),
-            "back_center": (rows - 1, cols // 2),
-        }
-        if identifier in mapping:
-            return mapping[identifier]
+        anchor = _anchor_mapping(rows, cols).get(identifier)
+        if anchor is not None:
+            return anchor
         parsed = VisualRecommendationsDialog._parse_grid_identifier(identifier)
         if not parsed:
             return None
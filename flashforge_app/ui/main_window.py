@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterator, Optional
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QDragEnterEvent, QDropEvent
@@ -31,6 +32,11 @@ from flashforge_app.ui.widgets import AnimatedStackedWidget, SideMenu, TopBar
 from flashforge_app.ui.theme import apply_theme
 
 
+_ICONS_DIR = Path(__file__).resolve().parent / "assets" / "icons"
+_CFG_SUFFIXES = frozenset({".cfg", ".conf"})
+_CSV_SUFFIXES = frozenset({".csv"})
+
+
 class MainWindow(QMainWindow):
     """Main window combining navigation, top bar, and functional views."""
 
@@ -53,17 +59,24 @@ class MainWindow(QMainWindow):
         self._stack = AnimatedStackedWidget()
         self._navigation = SideMenu()
         self._views: Dict[str, QWidget] = {}
+        self._visual_dialog: Optional[VisualRecommendationsDialog] = None
+        self._visual_dialog_key: Optional[tuple[str, str]] = None
 
         self.bed_view = BedLevelingView(self.localization, self.app_state, self)
-        self.shaper_view = InputShaperView(self.localization, self.app_state, self)
-        self.settings_view = SettingsView(self.settings_service, self.localization, self.app_state, self)
-        self.ssh_view = SSHTab(self.localization, self.app_state, self)
+        # The remaining views are built on first use, see _view().
+        self._view_factories: Dict[str, Callable[[], QWidget]] = {
+            "shaper": self._create_shaper_view,
+            "ssh": self._create_ssh_view,
+            "settings": self._create_settings_view,
+        }
 
         self._build_ui()
         self._populate_views()
         self._connect_signals()
         self._apply_translations()
         self._restore_last_file()
+        # Warm the author dialog image in the background; it is only shown on demand.
+        AuthorDialog.preload_easter_egg()
 
     # ------------------------------------------------------------------ UI construction
     def _build_ui(self) -> None:
@@ -154,14 +167,8 @@ class MainWindow(QMainWindow):
 
     # ------------------------------------------------------------------ view population
     def _populate_views(self) -> None:
-        self._views = {
-            "bed": self.bed_view,
-            "shaper": self.shaper_view,
-            "ssh": self.ssh_view,
-            "settings": self.settings_view,
-        }
-        for view in self._views.values():
-            self._stack.addWidget(view)
+        self._views = {"bed": self.bed_view}
+        self._stack.addWidget(self.bed_view)
 
         self._navigation.add_entry("bed", "Bed Leveling", self._icon_path("bed.svg"))
         self._navigation.add_entry("shaper", "Input Shaper", self._icon_path("shaper.svg"))
@@ -177,9 +184,6 @@ class MainWindow(QMainWindow):
         self._top_bar.author_button_clicked.connect(self._show_author_dialog)
         self.bed_view.load_printer_requested.connect(self._trigger_load_printer)
         self.bed_view.visual_recommendations_requested.connect(self._show_visual_recommendations)
-        self.shaper_view.csv_loaded.connect(self._on_shaper_csv_loaded)
-        self.ssh_view.config_downloaded.connect(self._on_config_downloaded)
-        self.ssh_view.shaper_files_downloaded.connect(self._on_shaper_files_downloaded)
 
     # ------------------------------------------------------------------ translations
     def _apply_translations(self) -> None:
@@ -187,15 +191,10 @@ class MainWindow(QMainWindow):
         self.sidebar_title.setText(tr("neo_ui.sidebar.title"))
         self.sidebar_caption.setText(tr("neo_ui.sidebar.caption"))
 
-        self._navigation.set_label("bed", tr("neo_ui.nav.bed"))
-        self._navigation.set_label("shaper", tr("neo_ui.nav.shaper"))
-        self._navigation.set_label("ssh", tr("neo_ui.nav.ssh"))
-        self._navigation.set_label("settings", tr("neo_ui.nav.settings"))
+        self._navigation.set_labels({key: tr(f"neo_ui.nav.{key}") for key in ("bed", "shaper", "ssh", "settings")})
 
-        self.bed_view.apply_translations()
-        self.shaper_view.apply_translations()
-        self.ssh_view.apply_translations()
-        self.settings_view.apply_translations()
+        for view in self._views.values():
+            view.apply_translations()
 
         self._top_bar.apply_translations(
             title=tr("neo_ui.top_bar.title"),
@@ -207,11 +206,50 @@ class MainWindow(QMainWindow):
         self._top_bar.set_status(tr("neo_ui.top_bar.status.ready"))
         self._top_bar.set_theme_icon(self.app_state.current_settings.theme)
 
+    # ------------------------------------------------------------------ lazily built views
+    def _view(self, key: str) -> QWidget:
+        view = self._views.get(key)
+        if view is None:
+            view = self._view_factories[key]()
+            view.apply_translations()
+            self._views[key] = view
+            self._stack.addWidget(view)
+        return view
+
+    def _create_shaper_view(self) -> InputShaperView:
+        view = InputShaperView(self.localization, self.app_state, self)
+        view.csv_loaded.connect(self._on_shaper_csv_loaded)
+        return view
+
+    def _create_ssh_view(self) -> SSHTab:
+        view = SSHTab(self.localization, self.app_state, self)
+        view.config_downloaded.connect(self._on_config_downloaded)
+        view.shaper_files_downloaded.connect(self._on_shaper_files_downloaded)
+        return view
+
+    def _create_settings_view(self) -> SettingsView:
+        view = SettingsView(self.settings_service, self.localization, self.app_state, self)
+        view.workflow_runner.finished.connect(self._on_workflow_computed)
+        view.workflow_runner.failed.connect(self._on_workflow_failed)
+        return view
+
+    @property
+    def shaper_view(self) -> InputShaperView:
+        return self._view("shaper")  # type: ignore[return-value]
+
+    @property
+    def ssh_view(self) -> SSHTab:
+        return self._view("ssh")  # type: ignore[return-value]
+
+    @property
+    def settings_view(self) -> SettingsView:
+        return self._view("settings")  # type: ignore[return-value]
+
     # ------------------------------------------------------------------ navigation + data
     def _switch_view(self, key: str) -> None:
-        widget = self._views.get(key)
-        if not widget:
+        if key not in self._views and key not in self._view_factories:
             return
+        widget = self._view(key)
         self._stack.setCurrentWidget(widget)
         if hasattr(widget, "on_view_activated"):
             widget.on_view_activated()
@@ -268,13 +306,25 @@ class MainWindow(QMainWindow):
             )
             return
 
-        dialog = VisualRecommendationsDialog(
-            self.localization,
-            workflow,
-            self.app_state.current_settings,
-            self.app_state.current_settings.theme,
-            self,
-        )
+        settings = self.app_state.current_settings
+        # The dialog is kept between openings; texts and colours are fixed at
+        # construction, so only a theme or language change builds a new one.
+        dialog_key = (settings.theme, self.localization.current_language)
+        dialog = self._visual_dialog
+        if dialog is not None and self._visual_dialog_key == dialog_key:
+            dialog.update_workflow(workflow, settings)
+        else:
+            if dialog is not None:
+                dialog.deleteLater()
+            dialog = VisualRecommendationsDialog(
+                self.localization,
+                workflow,
+                settings,
+                settings.theme,
+                self,
+            )
+            self._visual_dialog = dialog
+            self._visual_dialog_key = dialog_key
         dialog.exec()
 
     def _show_author_dialog(self) -> None:
@@ -287,23 +337,38 @@ class MainWindow(QMainWindow):
             return
         self.app_state.current_settings.language = language_code
         self.settings_service.save()
-        self._apply_translations()
+        with self._updates_suspended():
+            self._apply_translations()
 
     def _toggle_theme(self) -> None:
         current = self.app_state.current_settings.theme
         new_theme = "light" if current == "dark" else "dark"
         self.app_state.current_settings.theme = new_theme
         self.settings_service.save()
-        apply_theme(QApplication.instance(), new_theme)
-        self._top_bar.set_theme_icon(new_theme)
-        self.bed_view.on_theme_changed()
-        self.shaper_view.on_theme_changed()
-        self.settings_view.apply_translations()
-        self.ssh_view.apply_translations()
+        with self._updates_suspended():
+            apply_theme(QApplication.instance(), new_theme)
+            self._top_bar.set_theme_icon(new_theme)
+            self.bed_view.on_theme_changed()
+            # Views that were never opened pick up the theme when they are built.
+            if "shaper" in self._views:
+                self.shaper_view.on_theme_changed()
+            if "settings" in self._views:
+                self.settings_view.apply_translations()
+            if "ssh" in self._views:
+                self.ssh_view.apply_translations()
 
     # ------------------------------------------------------------------ helpers
+    @contextmanager
+    def _updates_suspended(self) -> Iterator[None]:
+        """Defer repaints of the whole window until a batch of restyling is done."""
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+
     def _icon_path(self, icon: str) -> Path:
-        return Path(__file__).resolve().parent / "assets" / "icons" / icon
+        return _ICONS_DIR / icon
 
     def _on_shaper_csv_loaded(self, path: Path) -> None:
         self._top_bar.set_status(
@@ -317,14 +382,22 @@ class MainWindow(QMainWindow):
         if self.app_state.workspace:
             self.bed_view.set_workspace(self.app_state.workspace)
 
+    def _on_workflow_computed(self, workflow: object) -> None:
+        self.bed_view.refresh_workflow()
+
+    def _on_workflow_failed(self, error: Exception) -> None:
+        tr = self.localization.translate
+        self.bed_view.refresh_workflow()
+        QMessageBox.critical(self, tr("neo_ui.common.error"), tr("neo_ui.errors.workflow_failed"))
+
     def _on_shaper_files_downloaded(self, files: list[Path]) -> None:
-        ordered: list[Path] = []
-        for axis in ('x', 'y'):
-            ordered.extend([f for f in files if self.shaper_view._infer_axis_from_filename(f) == axis])
-        ordered.extend([f for f in files if f not in ordered])
+        # X first, then Y, then files without a recognisable axis; the sort is
+        # stable, so the download order is kept within each group.
+        axis_order = {'x': 0, 'y': 1}
+        hinted = [(file, self.shaper_view._infer_axis_from_filename(file)) for file in files]
+        hinted.sort(key=lambda item: axis_order.get(item[1], 2))
 
-        for file in ordered:
-            axis_hint = self.shaper_view._infer_axis_from_filename(file)
+        for file, axis_hint in hinted:
             self.shaper_view.load_csv_file(file, axis_hint=axis_hint)
 
     # ------------------------------------------------------------------ drag and drop support
@@ -341,16 +414,21 @@ class MainWindow(QMainWindow):
 
         paths = [Path(url.toLocalFile()) for url in event.mimeData().urls() if url.isLocalFile()]
         handled = False
+        printer_file: Optional[Path] = None
         for path in paths:
-            if path.suffix.lower() in {".cfg", ".conf"}:
-                self._load_printer_file(path, notify=True)
+            suffix = path.suffix.lower()
+            if suffix in _CFG_SUFFIXES:
+                # Every config replaces the workspace, so only the last one is loaded.
+                printer_file = path
                 handled = True
-            elif path.suffix.lower() == ".csv":
+            elif suffix in _CSV_SUFFIXES:
                 if self.shaper_view.load_csv_file(path):
                     self._top_bar.set_status(
                         self.localization.translate("neo_ui.shaper.status.loaded").format(file=path.name)
                     )
                     handled = True
+        if printer_file is not None:
+            self._load_printer_file(printer_file, notify=True)
 
         if not handled:
             QMessageBox.warning(
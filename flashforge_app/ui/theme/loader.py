@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Optional
 
-from PySide6.QtCore import QFile, QTextStream
 from PySide6.QtGui import QFontDatabase
 from PySide6.QtWidgets import QApplication
 
@@ -11,29 +11,47 @@ from .palette import Palette
 
 THEME_DIR = Path(__file__).resolve().parent
 
+# Stylesheet text per theme and whether bundled fonts were registered; both
+# are read from disk once per process, theme toggles only reapply them.
+_stylesheet_cache: dict[str, str] = {}
+_fonts_loaded = False
+
 
 def apply_theme(app: QApplication, theme: str = "dark") -> None:
     """Load the global stylesheet for the requested theme."""
     _load_fonts()
     if theme not in {"dark", "light"}:
         theme = "dark"
+    stylesheet = _stylesheet_cache.get(theme)
+    if stylesheet is None:
+        stylesheet = _read_stylesheet(theme)
+    if stylesheet is not None:
+        app.setStyleSheet(stylesheet)
+    app.setProperty("currentTheme", theme)
+
+
+def _read_stylesheet(theme: str) -> Optional[str]:
     stylesheet_path = THEME_DIR / f"style_{theme}.qss"
     if not stylesheet_path.exists():
         stylesheet_path = THEME_DIR / "style_dark.qss"
-    if stylesheet_path.exists():
-        file = QFile(str(stylesheet_path))
-        if file.open(QFile.ReadOnly | QFile.Text):
-            stream = QTextStream(file)
-            stylesheet = stream.readAll()
-            app.setStyleSheet(stylesheet)
-            file.close()
-    app.setProperty("currentTheme", theme)
+    if not stylesheet_path.exists():
+        return None
+    try:
+        stylesheet = stylesheet_path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    _stylesheet_cache[theme] = stylesheet
+    return stylesheet
 
 
 def _load_fonts() -> None:
     """
     Attempt to load bundled fonts; quietly ignore if unavailable.
     """
+    global _fonts_loaded
+    if _fonts_loaded:
+        return
+    _fonts_loaded = True
     fonts_dir = THEME_DIR / "fonts"
     if not fonts_dir.exists():
         return
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import Optional
 
-import numpy as np
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QFrame,
@@ -32,7 +31,7 @@ class DashboardView(QWidget):
         super().__init__(parent)
         self.localization = localization
         self.app_state = app_state
-        self.workspace: Optional[BedWorkspace] = None
+        self._workspace_attached = False
 
         layout = QVBoxLayout()
         layout.setContentsMargins(4, 4, 4, 4)
@@ -121,12 +120,18 @@ class DashboardView(QWidget):
         self._refresh_cards()
 
     # ------------------------------------------------------------------ data handling
+    @property
+    def workspace(self) -> Optional[BedWorkspace]:
+        # AppState swaps in a new frozen workspace on every recompute,
+        # so always read the live one instead of keeping a copy.
+        return self.app_state.workspace if self._workspace_attached else None
+
     def update_workspace(self, workspace: BedWorkspace) -> None:
-        self.workspace = workspace
+        self._workspace_attached = workspace is not None
         self._refresh_cards()
 
     def clear_workspace(self) -> None:
-        self.workspace = None
+        self._workspace_attached = False
         self._refresh_cards()
 
     def _refresh_cards(self) -> None:
@@ -139,9 +144,7 @@ class DashboardView(QWidget):
             self.card_shaper_status.set_subtitle(self.localization.translate("neo_ui.dashboard.shaper_pending"))
             return
 
-        matrix = self.workspace.mesh_matrix
-        max_delta = float(np.max(matrix) - np.min(matrix))
-        average = float(np.mean(matrix))
+        max_delta, average = self.workspace.mesh_stats
 
         self.card_max_delta.set_value(f"{max_delta:.3f} mm")
         self.card_mean_height.set_value(f"{average:+.3f} mm")
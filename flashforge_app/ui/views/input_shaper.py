@@ -15,6 +15,7 @@ from PySide6.QtWidgets import (
     QGridLayout,
     QHBoxLayout,
     QLabel,
+    QLayout,
     QMessageBox,
     QPushButton,
     QVBoxLayout,
@@ -36,6 +37,17 @@ from flashforge_app.services.localization import LocalizationService
 from flashforge_app.state import AppState
 
 
+def _clear_layout(layout: QLayout) -> None:
+    """Remove every item, taking from the end so Qt never shifts the item list."""
+    widgets = []
+    for index in range(layout.count() - 1, -1, -1):
+        widget = layout.takeAt(index).widget()
+        if widget:
+            widgets.append(widget)
+    for widget in widgets:
+        widget.deleteLater()
+
+
 class _AxisPlot(QFrame):
     def __init__(self, title: str, parent: QWidget | None = None) -> None:
         super().__init__(parent)
@@ -120,27 +132,7 @@ class _AxisInfo(QFrame):
 
     def update_info(self, recommended_text: str, entries: list[dict]) -> None:
         self.recommend_label.setText(recommended_text)
-        for label in self._line_labels:
-            self.lines_container.removeWidget(label)
-            label.deleteLater()
-        for button in self._buttons:
-            self.buttons_container.removeWidget(button)
-            button.deleteLater()
-        self._line_labels = []
-        self._buttons = []
-
-        while self.lines_container.count():
-            item = self.lines_container.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-        while self.buttons_container.count():
-            item = self.buttons_container.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-        self._line_labels = []
-        self._buttons = []
+        self._clear_entries()
 
         for entry in entries:
             bullet = f"<span style='color:{entry['color']}; font-size:16px;'>●</span> "
@@ -176,16 +168,11 @@ class _AxisInfo(QFrame):
 
     def clear(self, placeholder: str) -> None:
         self.recommend_label.setText(placeholder)
-        while self.lines_container.count():
-            item = self.lines_container.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-        while self.buttons_container.count():
-            item = self.buttons_container.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+        self._clear_entries()
+
+    def _clear_entries(self) -> None:
+        _clear_layout(self.lines_container)
+        _clear_layout(self.buttons_container)
         self._line_labels = []
         self._buttons = []
 
@@ -3,7 +3,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-import numpy as np
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
@@ -42,7 +41,7 @@ class BedLevelingView(QWidget):
         super().__init__(parent)
         self.localization = localization
         self.app_state = app_state
-        self.workspace: Optional[BedWorkspace] = None
+        self._workspace_attached = False
         self.heatmap_canvas: Optional[FigureCanvasQTAgg] = None
         self.surface_canvas: Optional[FigureCanvasQTAgg] = None
         self._heatmap = BedMeshHeatmap()
@@ -225,16 +224,28 @@ class BedLevelingView(QWidget):
         self.apply_translations()
 
     # ------------------------------------------------------------------ workspace updates
+    @property
+    def workspace(self) -> Optional[BedWorkspace]:
+        # AppState swaps in a new frozen workspace on every recompute,
+        # so always read the live one instead of keeping a copy.
+        return self.app_state.workspace if self._workspace_attached else None
+
     def set_workspace(self, workspace: BedWorkspace) -> None:
-        self.workspace = workspace
+        self._workspace_attached = workspace is not None
         self._refresh_cards()
         self._update_recommendations()
         self._render_visualizations()
         self._update_visual_controls()
         self._update_last_file_label(self.app_state.last_printer_cfg)
 
+    def refresh_workflow(self) -> None:
+        """Pick up a workflow that was recomputed after the workspace was set."""
+        self._refresh_cards()
+        self._update_recommendations()
+        self._update_visual_controls()
+
     def clear_workspace(self) -> None:
-        self.workspace = None
+        self._workspace_attached = False
         self._refresh_cards()
         self._update_recommendations()
         self._update_visual_controls()
@@ -256,9 +267,7 @@ class BedLevelingView(QWidget):
             self.card_status.set_subtitle(tr("neo_ui.bed.status.load_hint"))
             return
 
-        matrix = self.workspace.mesh_matrix
-        max_delta = float(np.max(matrix) - np.min(matrix))
-        average = float(np.mean(matrix))
+        max_delta, average = self.workspace.mesh_stats
         self.card_delta.set_value(f"{max_delta:.3f} {unit_mm}")
         self.card_average.set_value(f"{average:+.3f} {unit_mm}")
 
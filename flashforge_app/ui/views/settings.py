@@ -22,6 +22,7 @@ from PySide6.QtWidgets import QButtonGroup
 from flashforge_app.services.localization import LocalizationService
 from flashforge_app.services.settings import ApplicationSettings, SettingsService, ThermalPreset
 from flashforge_app.state import AppState
+from flashforge_app.ui.workers import WorkflowRunner
 
 GITHUB_RELEASE_URL = "https://github.com/lDOCI/Centaur-Calibration-Assistant-v2/releases/latest"
 
@@ -41,6 +42,8 @@ class SettingsView(QWidget):
         self.localization = localization
         self.app_state = app_state
         self.settings: ApplicationSettings = self.settings_service.settings
+        # Settings edits recompute the workflow off the GUI thread.
+        self.workflow_runner = WorkflowRunner(app_state, self)
 
         layout = QVBoxLayout()
         layout.setContentsMargins(8, 8, 8, 8)
@@ -266,7 +269,7 @@ class SettingsView(QWidget):
             for key, checkbox in self.workflow_checks.items():
                 setattr(workflow, key, checkbox.isChecked())
 
-            self.app_state.update_settings(self.settings)
+            self._apply_settings(self.settings)
             QMessageBox.information(self, "", tr("settings_tab.settings_saved"))
         except ValueError:
             QMessageBox.warning(self, tr("Warning"), tr("settings_tab.numeric_error"))
@@ -277,9 +280,13 @@ class SettingsView(QWidget):
         self.settings = default
         self.settings_service.settings = default
         self._refresh_fields()
-        self.app_state.update_settings(default)
+        self._apply_settings(default)
         QMessageBox.information(self, "", tr("settings_tab.settings_reset"))
 
+    def _apply_settings(self, settings: ApplicationSettings) -> None:
+        if self.app_state.update_settings(settings, recompute=False):
+            self.workflow_runner.start()
+
     def _open_release_page(self) -> None:
         QDesktopServices.openUrl(QUrl(GITHUB_RELEASE_URL))
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional
 
 from PySide6.QtCore import QSize, Qt, Signal
 from PySide6.QtGui import QIcon
@@ -43,6 +43,15 @@ class SideMenu(QListWidget):
         if item:
             item.setText(label)
 
+    def set_labels(self, labels: Mapping[str, str]) -> None:
+        """Relabel several entries at once with a single repaint."""
+        self.setUpdatesEnabled(False)
+        try:
+            for key, label in labels.items():
+                self.set_label(key, label)
+        finally:
+            self.setUpdatesEnabled(True)
+
     def _handle_selection_change(self, current: QListWidgetItem | None, previous: QListWidgetItem | None) -> None:
         if not current:
             return
@@ -0,0 +1,70 @@
+"""
+Background workers that keep heavy computations off the GUI thread.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from calibration.workflow import WorkflowData
+from flashforge_app.state import AppState
+
+
+class _WorkflowSignals(QObject):
+    done = Signal(int, object)
+    failed = Signal(int, object)
+
+
+class _WorkflowTask(QRunnable):
+    def __init__(self, generation: int, job: Callable[[], WorkflowData], signals: _WorkflowSignals) -> None:
+        super().__init__()
+        self._generation = generation
+        self._job = job
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            workflow = self._job()
+        except Exception as exc:  # noqa: BLE001
+            self._signals.failed.emit(self._generation, exc)
+            return
+        self._signals.done.emit(self._generation, workflow)
+
+
+class WorkflowRunner(QObject):
+    """
+    Recomputes the AppState workflow on the global QThreadPool.
+
+    Results are delivered back on the GUI thread; only the most recently
+    started computation is stored, older ones are discarded as stale.
+    ``failed`` carries the exception of a computation that raised.
+    """
+
+    finished = Signal(object)
+    failed = Signal(object)
+
+    def __init__(self, app_state: AppState, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.app_state = app_state
+        # Lives in the GUI thread, so emitting from the pool queues the slot call here.
+        self._signals = _WorkflowSignals(self)
+        self._signals.done.connect(self._on_done)
+        self._signals.failed.connect(self._on_failed)
+
+    def start(self) -> bool:
+        pending = self.app_state.workflow_job(detached=True)
+        if pending is None:
+            return False
+        generation, job = pending
+        QThreadPool.globalInstance().start(_WorkflowTask(generation, job, self._signals))
+        return True
+
+    def _on_done(self, generation: int, workflow: WorkflowData) -> None:
+        if self.app_state.apply_workflow(generation, workflow):
+            self.finished.emit(workflow)
+
+    def _on_failed(self, generation: int, error: Exception) -> None:
+        if self.app_state.is_current_workflow(generation):
+            self.failed.emit(error)
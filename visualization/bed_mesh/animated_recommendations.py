@@ -30,7 +30,8 @@ class ScrewAdjustmentVisualizer:
     Создает фигуру с визуализацией винтов и анимацией дуг.
 
     Интерфейс совместим с Qt: фон прозрачный, blit отключен, ссылка на анимацию
-    сохраняется внутри Figure.
+    сохраняется внутри Figure (fig.animation), а анимируемые дуги - в
+    fig.animated_artists, чтобы владелец canvas мог включить blitting.
     """
 
     def __init__(
@@ -255,7 +256,8 @@ class ScrewAdjustmentVisualizer:
             )
             info_lines.append(direction_text)
 
-            ax.text(
+            # Символ поверх дуги перерисовывается вместе с ней (см. animated_artists)
+            animation_data[-1]['overlay'] = ax.text(
                 x,
                 y,
                 rotation_symbol,
@@ -455,7 +457,8 @@ class ScrewAdjustmentVisualizer:
             )
             info_lines.append(direction_text)
 
-            ax.text(
+            # Символ поверх дуги перерисовывается вместе с ней (см. animated_artists)
+            animation_data[-1]['overlay'] = ax.text(
                 x,
                 y,
                 str(teeth),
@@ -656,7 +659,8 @@ class ScrewAdjustmentVisualizer:
             )
             info_lines.append(direction_text)
 
-            ax.text(
+            # Символ поверх дуги перерисовывается вместе с ней (см. animated_artists)
+            animation_data[-1]['overlay'] = ax.text(
                 x,
                 y,
                 rotation_symbol,
@@ -755,6 +759,12 @@ class ScrewAdjustmentVisualizer:
             return None
 
         total_frames = max(frames, 2)
+        fig.animated_artists = [
+            artist
+            for data in items
+            for artist in (data['wedge'], data.get('overlay'))
+            if artist is not None
+        ]
 
         def init():
             patches_to_update = []